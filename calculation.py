@@ -25,8 +25,13 @@ Main file for calculation
 
 import numpy as np
 from typing import Dict
+from scipy.linalg import lu_factor, lu_solve
 from scipy.sparse import csr_array
-import copy
+# Numba is optional, without it the system matrix is assembled with SciPy
+try:
+    from numba import njit
+except ImportError:
+    njit = None
 
 
 # Define static function to calculate stresses
@@ -50,52 +55,90 @@ def sigma(eps, lin_coeff, quad_coeff, e_mod, eps_f):
     return sigma_vals
 
 
-class Element:
+def element_matrices(cos_theta, sin_theta, stiffness):
     """
-    The "Element" class contains the element information (nodes, cross-section, material parameters) and calculates the\n
-    element stiffness matrix.
+    Calculates the local and global element stiffness matrices and the transformation matrices of all elements at once.
+    The inputs are arrays with one entry per element, stiffness is E * A / L.
+    :return:
     """
+    num_elem = len(stiffness)
+    k_local = stiffness.reshape(-1, 1, 1) * np.array([
+        [1, 0, -1, 0],
+        [0, 0, 0, 0],
+        [-1, 0, 1, 0],
+        [0, 0, 0, 0]
+    ])
+
+    # Transformation matrices
+    transformation_matrix = np.zeros((num_elem, 4, 4))
+    for block in (0, 2):
+        transformation_matrix[:, block, block] = cos_theta
+        transformation_matrix[:, block, block + 1] = sin_theta
+        transformation_matrix[:, block + 1, block] = -sin_theta
+        transformation_matrix[:, block + 1, block + 1] = cos_theta
+
+    k_global = transformation_matrix @ k_local @ np.transpose(transformation_matrix, (0, 2, 1))
+
+    return k_local, k_global, transformation_matrix
+
+
+def assemble_dense(ele_dofs, ele_k_global, size):
+    """
+    Adds the global element stiffness matrices of all elements into a dense system matrix of the given size.
+    Compiled once with Numba and cached on disk, the loops only see arrays.
+    :return:
+    """
+    k_sys = np.zeros((size, size))
+    for element in range(ele_dofs.shape[0]):
+        for row in range(4):
+            for col in range(4):
+                k_sys[ele_dofs[element, row], ele_dofs[element, col]] += ele_k_global[element, row, col]
+    return k_sys
 
-    def __init__(self, node_i, node_j, cross_section_area, youngs_modulus):
-        self.node_i = node_i
-        self.node_j = node_j
-        self.cross_section_area = cross_section_area
-        self.youngs_modulus = youngs_modulus
-        self.k_local = []
-        self.k_global = []
-        self.length = 0
-        self.transformation_matrix = []
-
-    def calculate_element_matrices(self):
-        """
-        Calculates the local and the global element stiffness matrix.
-        :return:
-        """
-        delta_x = self.node_j[0] - self.node_i[0]
-        delta_y = self.node_j[1] - self.node_i[1]
-        self.length = np.sqrt(delta_x ** 2 + delta_y ** 2)
 
-        cos_theta = delta_x / self.length
-        sin_theta = - delta_y / self.length
+if njit is not None:
+    assemble_dense = njit(cache=True)(assemble_dense)
 
-        self.k_local = (self.cross_section_area * self.youngs_modulus / self.length) * np.array([
-            [1, 0, -1, 0],
-            [0, 0, 0, 0],
-            [-1, 0, 1, 0],
-            [0, 0, 0, 0]
-        ])
 
-        # Transformation matrix
-        self.transformation_matrix = np.array([
-            [cos_theta, sin_theta, 0, 0],
-            [-sin_theta, cos_theta, 0, 0],
-            [0, 0, cos_theta, sin_theta],
-            [0, 0, -sin_theta, cos_theta]
-        ])
+def scatter_dofs(ele_dofs, ele_values, size):
+    """
+    Sums the values of all elements at their global DOFs into a column vector of the given size.
+    Same order of summation as np.add.at, but in a single pass of np.bincount.
+    :return:
+    """
+    return np.bincount(ele_dofs.ravel(), weights=ele_values.ravel(), minlength=size).reshape(-1, 1)
 
-        self.k_global = self.transformation_matrix @ self.k_local @ np.transpose(self.transformation_matrix)
 
-        return self.k_local, self.k_global, self.transformation_matrix, self.length
+def input_arrays(elements, supports, forces):
+    """
+    Converts the element, support and force dicts to arrays with one row per element, support and force.
+    Element rows are x_i, y_i, x_j, y_j, A, E, α, β, ε_f, support rows are x, y, c_x, c_y with inf for a rigid
+    support and force rows are x, y, f_x, f_y.
+    :return:
+    """
+    element_array = np.array([(*ele['ele_node_i'], *ele['ele_node_j'], ele['ele_A'], ele['ele_E'],
+                               ele['ele_lin_coeff'], ele['ele_quad_coeff'], ele['ele_eps_f'])
+                              for ele in elements.values()], dtype=np.float64).reshape(-1, 9)
+    support_array = np.array([(*sup['sup_node'], np.inf if sup['c_x'] == '∞' else sup['c_x'],
+                               np.inf if sup['c_y'] == '∞' else sup['c_y'])
+                              for sup in supports.values()], dtype=np.float64).reshape(-1, 4)
+    force_array = np.array([(*force['force_node'], force['f_x'], force['f_y']) for force in forces.values()],
+                           dtype=np.float64).reshape(-1, 4)
+    return element_array, support_array, force_array
+
+
+def warm_up():
+    """
+    Solves a single bar once, so the lazily loaded NumPy and SciPy routines are ready for the first calculation.
+    :return:
+    """
+    elements = {0: {'ele_number': 0, 'ele_node_i': (0., 0.), 'ele_node_j': (1., 0.), 'ele_A': 1., 'ele_E': 1.,
+                    'ele_lin_coeff': 1., 'ele_quad_coeff': 0., 'ele_eps_f': 0.}}
+    supports = {0: {'sup_number': 0, 'sup_node': (0., 0.), 'c_x': '∞', 'c_y': '∞'},
+                1: {'sup_number': 1, 'sup_node': (1., 0.), 'c_x': 1., 'c_y': '∞'}}
+    forces = {0: {'force_number': 0, 'force_node': (1., 0.), 'f_x': 1., 'f_y': 0.}}
+    calc_param = {'calc_method': 'linear', 'number_of_iterations': 0, 'delta_f_max': 1.}
+    return Calculation(elements, supports, forces, calc_param).return_solution()
 
 
 class Calculation:
@@ -104,11 +147,17 @@ class Calculation:
     """
 
     def __init__(self, elements: Dict, supports: Dict, forces: Dict, calc_param: Dict):
-        self.elements = elements
-        self.supports = supports
-        self.forces = forces
+        # Input as arrays with one row per element, support and force, see input_arrays
+        self.element_array, self.support_array, self.force_array = input_arrays(elements, supports, forces)
         self.calc_param = calc_param
-        self.element_matrices = []
+        # Element data as struct of arrays, one entry (row) per element
+        self.ele_dofs = np.zeros((0, 4), dtype=np.int64)
+        self.ele_length = np.zeros(0)
+        self.ele_cos = np.zeros(0)
+        self.ele_sin = np.zeros(0)
+        self.ele_k_local = np.zeros((0, 4, 4))
+        self.ele_k_global = np.zeros((0, 4, 4))
+        self.ele_transformation = np.zeros((0, 4, 4))
         self.k_sys = np.array([0], dtype=np.float64)
         self.nodes = []
         self.solution = {}
@@ -126,9 +175,22 @@ class Calculation:
         self.strains_linear = []
         self.strains_nonlinear = []
         self.iter_break_number = 0
+        self.step_max = None
         self.e_linalg = None
         self.spring_index = []
 
+    @classmethod
+    def from_arrays(cls, element_array, support_array, force_array, calc_param: Dict):
+        """
+        Creates the calculation from input arrays in the row format of input_arrays, without dicts.
+        :return:
+        """
+        calculation = cls({}, {}, {}, calc_param)
+        calculation.element_array = element_array
+        calculation.support_array = support_array
+        calculation.force_array = force_array
+        return calculation
+
     def return_solution(self):
         """
         Returns the solution as a dictionary.
@@ -143,55 +205,43 @@ class Calculation:
         :return:
         """
 
-        self.num_elem = len(self.element_matrices)
-        # Pre-allocate lists for sparse matrix data.
-        # i_g and j_g are used to index the global matrices
-        # k_g and m_g will contain the element matrices in vector format
-        i_g = []
-        j_g = []
-        k_g = []
-        num_dofs = 0
-
-        # Convert the element stiffness and mass matrices to vector format (k_g and m_g) and define the corresponding
-        # indices i_g and j_g in the global mass/stiffness matrix
-        for i in range(self.num_elem):
-            dof_i = self.element_matrices[i]['DOFs']
-            k_i = self.element_matrices[i]['K_global']
-            dof_i_len = len(dof_i)
-            mesh1, mesh2 = np.meshgrid(range(dof_i_len), range(dof_i_len), indexing='ij')
-            ii = mesh1.ravel()
-            jj = mesh2.ravel()
-            i_g.extend(dof_i[ii])
-            j_g.extend(dof_i[jj])
-            k_g.extend(k_i.ravel())
-            max_dof_i = max(dof_i)
-            num_dofs = max(num_dofs, max_dof_i)
-
-        # Create sparse matrix for K
-        k_sys = csr_array((k_g, (np.array(i_g), np.array(j_g))), shape=(num_dofs + 1, num_dofs + 1), dtype=np.float64)
-        k_sys = k_sys.toarray()
+        self.num_elem = len(self.ele_dofs)
+        num_dofs = self.ele_dofs.max()
+        if njit is not None:
+            # Compiled assembly loop
+            k_sys = assemble_dense(self.ele_dofs, self.ele_k_global, num_dofs + 1)
+        else:
+            # Convert the element stiffness matrices to vector format (k_g) and define the corresponding
+            # indices i_g and j_g in the global stiffness matrix, row-major like the element matrices
+            i_g = np.repeat(self.ele_dofs, 4, axis=1).ravel()
+            j_g = np.tile(self.ele_dofs, (1, 4)).ravel()
+            k_g = self.ele_k_global.ravel()
+
+            # Create sparse matrix for K
+            k_sys = csr_array((k_g, (i_g, j_g)), shape=(num_dofs + 1, num_dofs + 1), dtype=np.float64)
+            k_sys = k_sys.toarray()
         self.spring_index = np.zeros(k_sys.shape[0]).reshape(-1,1)
         # Assemble boundary conditions (supports/springs), if spring stiffness = 1 a rigid bc is applied
-        for support_id, support_values in self.supports.items():
+        for support_id, (node_x, node_y, c_x, c_y) in enumerate(self.support_array.tolist()):
             try:
-                index_nodes = self.node_to_index[support_values['sup_node']]
+                index_nodes = self.node_to_index[(node_x, node_y)]
             except KeyError:
-                print(f"The support {support_id} with the coordinates {support_values['sup_node']} is not connected "
+                print(f"The support {support_id} with the coordinates {(node_x, node_y)} is not connected "
                       f"to a truss element!")
                 break
-            if support_values['c_x'] != '∞':
-                if support_values['c_x'] > 0:
-                    k_sys[index_nodes * 2, index_nodes * 2] += support_values['c_x']
-                    self.spring_index[index_nodes * 2] = support_values['c_x']
-            elif support_values['c_x'] == '∞':
+            if c_x != np.inf:
+                if c_x > 0:
+                    k_sys[index_nodes * 2, index_nodes * 2] += c_x
+                    self.spring_index[index_nodes * 2] = c_x
+            else:
                 k_sys[index_nodes * 2, :] = 0
                 k_sys[:, index_nodes * 2] = 0
                 k_sys[index_nodes * 2, index_nodes * 2] = 1
-            if support_values['c_y'] != '∞':
-                if support_values['c_y'] > 0:
-                    k_sys[index_nodes * 2 + 1, index_nodes * 2 + 1] += support_values['c_y']
-                    self.spring_index[index_nodes * 2 + 1] = support_values['c_y']
-            elif support_values['c_y'] == '∞':
+            if c_y != np.inf:
+                if c_y > 0:
+                    k_sys[index_nodes * 2 + 1, index_nodes * 2 + 1] += c_y
+                    self.spring_index[index_nodes * 2 + 1] = c_y
+            else:
                 k_sys[index_nodes * 2 + 1, :] = 0
                 k_sys[:, index_nodes * 2 + 1] = 0
                 k_sys[index_nodes * 2 + 1, index_nodes * 2 + 1] = 1
@@ -199,58 +249,76 @@ class Calculation:
         # Return global stiffness matrix
         return k_sys
 
+    def nonlinear_residual(self, displacements_total, rows_to_zero, ele_lin_coeff, ele_quad_coeff, ele_e, ele_area,
+                           ele_eps_f):
+        """
+        Strain, axial forces and node equilibrium for the given total node displacements of the nonlinear iteration.
+        :return: strain, axial forces, node equilibrium, force mismatch (reduced at the supports)
+        """
+        displacements_local = np.einsum('nji,nj->ni', self.ele_transformation, displacements_total[self.ele_dofs, 0])
+        strain = ((displacements_local[:, 2] - displacements_local[:, 0]) / self.ele_length).reshape(-1, 1)
+        axial_forces = sigma(strain, ele_lin_coeff, ele_quad_coeff, ele_e, ele_eps_f) * ele_area
+        # The global element forces are the axial force times the first and third column of the transformation matrix
+        axial_forces_glob = axial_forces * (self.ele_transformation[:, :, 2] - self.ele_transformation[:, :, 0])
+        f_vec_cor = scatter_dofs(self.ele_dofs, axial_forces_glob, self.f_vec.shape[0])
+        spring_reactions_forces = self.spring_index * displacements_total
+        node_equilibrium = self.f_vec - f_vec_cor
+        f_vec_mismatch = node_equilibrium - spring_reactions_forces
+        f_vec_mismatch[rows_to_zero] = 0
+        return strain, axial_forces, node_equilibrium, f_vec_mismatch
+
     def start_calc(self):
         """Function to start the calculation."""
+        # Element data as struct of arrays, the columns of the element input array
+        ele_node_i = self.element_array[:, 0:2]
+        ele_node_j = self.element_array[:, 2:4]
+        ele_area = self.element_array[:, 4] * 10 ** -4  # unit conversion cm² -> m²
+        ele_e = self.element_array[:, 5] * 10 ** 3  # unit conversion MPa -> kN/m²
+        ele_lin_coeff = self.element_array[:, 6]
+        ele_quad_coeff = self.element_array[:, 7]
+        ele_eps_f = self.element_array[:, 8]
+        nodes_i = list(map(tuple, ele_node_i.tolist()))
+        nodes_j = list(map(tuple, ele_node_j.tolist()))
+
         # Create global node list
-        for element in self.elements.values():
+        for node_i, node_j in zip(nodes_i, nodes_j):
             # Check and add nodes to the list if they are not already in it
-            if element['ele_node_i'] not in self.nodes:
-                self.nodes.append(element['ele_node_i'])
-            if element['ele_node_j'] not in self.nodes:
-                self.nodes.append(element['ele_node_j'])
+            if node_i not in self.nodes:
+                self.nodes.append(node_i)
+            if node_j not in self.nodes:
+                self.nodes.append(node_j)
 
         # Create a mapping from node tuples to their index in the global_nodes_list
         self.node_to_index = {node: index for index, node in enumerate(self.nodes)}
 
-        # Calculate element stiffness matrices
-        ele_area = []
-        ele_e = []
-        ele_lin_coeff = []
-        ele_quad_coeff = []
-        ele_eps_f = []
-        for ele_id, ele_values in self.elements.items():
-            ele_id = int(ele_id)
-            ele_e.append(ele_values['ele_E'] * 10 ** 3)  # unit conversion MPa -> kN/m²
-            ele_area.append(ele_values['ele_A'] * 10 ** -4)  # unit conversion cm² -> m²
-            ele_node_i = ele_values['ele_node_i']
-            ele_node_j = ele_values['ele_node_j']
-            ele_lin_coeff.append(ele_values['ele_lin_coeff'])
-            ele_quad_coeff.append(ele_values['ele_quad_coeff'])
-            ele_eps_f.append(ele_values['ele_eps_f'])
-            # Find the global index for node_i and node_j
-            dofs = np.append([self.node_to_index[ele_node_i] * 2, self.node_to_index[ele_node_i] * 2 + 1],
-                             [self.node_to_index[ele_node_j] * 2, self.node_to_index[ele_node_j] * 2 + 1])
-            element_k_local, element_k_global, element_transformation, length = Element(ele_node_i, ele_node_j,
-                                                                                        ele_area[ele_id],
-                                                                                        ele_e[
-                                                                                            ele_id]).calculate_element_matrices()
-            self.element_matrices.append({'DOFs': dofs, 'K_local': element_k_local, 'K_global': element_k_global,
-                                          'transformation_matrix': element_transformation, 'length': length})
+        # Find the global DOFs of node_i and node_j
+        index_i = np.array([self.node_to_index[node] for node in nodes_i], dtype=np.int64)
+        index_j = np.array([self.node_to_index[node] for node in nodes_j], dtype=np.int64)
+        self.ele_dofs = np.column_stack((index_i * 2, index_i * 2 + 1, index_j * 2, index_j * 2 + 1))
+
+        # Calculate element geometry and stiffness matrices
+        delta_x = ele_node_j[:, 0] - ele_node_i[:, 0]
+        delta_y = ele_node_j[:, 1] - ele_node_i[:, 1]
+        self.ele_length = np.sqrt(delta_x ** 2 + delta_y ** 2)
+        self.ele_cos = delta_x / self.ele_length
+        self.ele_sin = - delta_y / self.ele_length
+        self.ele_k_local, self.ele_k_global, self.ele_transformation = element_matrices(
+            self.ele_cos, self.ele_sin, ele_area * ele_e / self.ele_length)
 
         # Assemble global stiffness matrix
         self.k_sys = self.assembly_system_matrix()
 
         # Assemble global load vector
         self.f_vec = np.zeros((self.k_sys.shape[0], 1))
-        for force_id, force_values in self.forces.items():
+        for force_id, (node_x, node_y, f_x, f_y) in enumerate(self.force_array.tolist()):
             try:
-                index_nodes = self.node_to_index[force_values['force_node']]
+                index_nodes = self.node_to_index[(node_x, node_y)]
             except KeyError:
-                print(f"The force {force_id} with the coordinates {force_values['force_node']} is not connected "
+                print(f"The force {force_id} with the coordinates {(node_x, node_y)} is not connected "
                       f"to a truss element!")
                 break
-            self.f_vec[index_nodes * 2] += force_values['f_x']
-            self.f_vec[index_nodes * 2 + 1] += force_values['f_y']
+            self.f_vec[index_nodes * 2] += f_x
+            self.f_vec[index_nodes * 2 + 1] += f_y
         # Set force vector entries to 0 at the positions of supports
         self.f_vec[np.diag(self.k_sys) == 1] = 0
 
@@ -262,29 +330,25 @@ class Calculation:
             print(f"An error occurred while solving the system of equations: {self.e_linalg}.")
             return
         # Calculate axial forces and strain
-        strain = []
-        internal_f_vec_glob = np.zeros(self.f_vec.shape)
-        for i in range(len(self.element_matrices)):
-            self.displacements_local.append(np.transpose(self.element_matrices[i]['transformation_matrix'])
-                                            @ self.displacements[self.element_matrices[i]['DOFs']])
-            axial_force_i = self.element_matrices[i]['K_local'] @ self.displacements_local[i]
-            axial_force_global_i = self.element_matrices[i]['transformation_matrix'] @ axial_force_i
-            self.axial_forces = np.append(self.axial_forces, axial_force_i[2])
-            strain.append((self.displacements_local[i][2] - self.displacements_local[i][0])
-                          / self.element_matrices[i]['length'])
-            internal_f_vec_glob[self.element_matrices[i]['DOFs']] += axial_force_global_i
+        self.displacements_local = np.einsum('nji,nj->ni', self.ele_transformation,
+                                             self.displacements[self.ele_dofs, 0])
+        axial_force_local = np.einsum('nij,nj->ni', self.ele_k_local, self.displacements_local)
+        axial_force_global = np.einsum('nij,nj->ni', self.ele_transformation, axial_force_local)
+        self.axial_forces = axial_force_local[:, 2]
+        strain = (self.displacements_local[:, 2] - self.displacements_local[:, 0]) / self.ele_length
+        internal_f_vec_glob = scatter_dofs(self.ele_dofs, axial_force_global, self.f_vec.shape[0])
         # Calculate global forces equilibrium to get support reactions
         self.node_equilibrium_linear = self.f_vec - internal_f_vec_glob
 
         # Newton-Raphson-Method for nonlinear stress-strain relationship
         displacements_cor = np.zeros((self.k_sys.shape[0], 1))
-        strain = np.array(strain).reshape(-1, 1)
+        strain = strain.reshape(-1, 1)
         self.strains_linear = strain
-        ele_lin_coeff = np.array(ele_lin_coeff).reshape(-1, 1)
-        ele_quad_coeff = np.array(ele_quad_coeff).reshape(-1, 1)
-        ele_e = np.array(ele_e).reshape(-1, 1)
-        ele_area = np.array(ele_area).reshape(-1, 1)
-        ele_eps_f = np.array(ele_eps_f).reshape(-1, 1)
+        ele_lin_coeff = ele_lin_coeff.reshape(-1, 1)
+        ele_quad_coeff = ele_quad_coeff.reshape(-1, 1)
+        ele_e = ele_e.reshape(-1, 1)
+        ele_area = ele_area.reshape(-1, 1)
+        ele_eps_f = ele_eps_f.reshape(-1, 1)
         # if self.calc_param['calc_method'] in 'NR' or 'modNR' and sum(ele_quad_coeff) != 0:
         if (self.calc_param['calc_method'] in 'NR' or self.calc_param['calc_method'] in 'modNR') and sum(
                 ele_quad_coeff) != 0:
@@ -293,54 +357,79 @@ class Calculation:
             if self.calc_param['number_of_iterations'] < 1:
                 print('The number of iterations has to be ≥ 1. "number_of_iterations" is set to 1.')
                 self.calc_param['number_of_iterations'] = 1
+            # Mismatch in node equilibrium of the linear solution, the rows of the supports are reduced
+            rows_to_zero = np.diag(self.k_sys) == 1
+            material = (ele_lin_coeff, ele_quad_coeff, ele_e, ele_area, ele_eps_f)
+            residual = self.nonlinear_residual(self.displacements, rows_to_zero, *material)
+            # The method and stop criteria are fixed for the calculation and are looked up once before the iteration
+            newton_raphson = self.calc_param['calc_method'] in 'NR'
+            stop_criterion = self.calc_param['delta_f_max']
+            step_criterion = self.calc_param.get('delta_u_max', 0)
+            # The stiffness of the modified Newton-Raphson method is constant, so it is factorized only once
+            if not newton_raphson:
+                k_sys_lu = lu_factor(self.k_sys)
             for iter_number in range(1, self.calc_param['number_of_iterations'] + 1):
-                # Update axial forces and stiffness (stiffness is constant in the modified Newton-Raphson method)
-                axial_forces_cor = sigma(strain, ele_lin_coeff, ele_quad_coeff, ele_e, ele_eps_f) * ele_area
-
-                # Calculate mismatch in node equilibrium
-                f_vec_cor = np.zeros(self.f_vec.shape)
-                for i in range(len(self.element_matrices)):
-                    axial_forces_cor_glob = (self.element_matrices[i]['transformation_matrix'] @
-                                             np.array([-axial_forces_cor[i][0], 0, axial_forces_cor[i][0], 0]).reshape(
-                                                 4, 1))
-                    f_vec_cor[self.element_matrices[i]['DOFs']] += axial_forces_cor_glob
-                spring_reactions_forces = self.spring_index * self.displacements_cor_total
-                self.f_vec_mismatch = self.f_vec - f_vec_cor
-                node_equilibrium = copy.copy(self.f_vec_mismatch)
-                self.f_vec_mismatch += - spring_reactions_forces
-                # Calculate additional displacements
-                if self.calc_param['calc_method'] in 'NR':
-                    for i in range(len(self.element_matrices)):
-                        ele_e_cor = (ele_lin_coeff + 2 * ele_quad_coeff * strain) * ele_e
-                        element_k_local, element_k_global, element_transformation, length \
-                            = (Element(self.elements[str(i)]['ele_node_i'], self.elements[str(i)]['ele_node_j'],
-                                       ele_area[i], ele_e_cor[i]).calculate_element_matrices())
-                        self.element_matrices[i]['K_global'] = element_k_global
+                # The residual of the accepted step is reused from the line search of the previous iteration
+                node_equilibrium, self.f_vec_mismatch = residual[2:]
+                # Update stiffness (stiffness is constant in the modified Newton-Raphson method)
+                if newton_raphson:
+                    ele_e_cor = (ele_lin_coeff + 2 * ele_quad_coeff * strain) * ele_e
+                    self.ele_k_global = element_matrices(self.ele_cos, self.ele_sin,
+                                                         (ele_area * ele_e_cor)[:, 0] / self.ele_length)[1]
                     # Assemble global stiffness matrix
                     self.k_sys = self.assembly_system_matrix()
 
-                # Reduce load vector and check stop criterion
-                rows_to_zero = np.diag(self.k_sys) == 1
-                self.f_vec_mismatch[rows_to_zero] = 0
-                stop_criterion = self.calc_param['delta_f_max']
-                if max(abs(self.f_vec_mismatch)) <= stop_criterion:
+                # Check stop criterion
+                if np.abs(self.f_vec_mismatch).max() <= stop_criterion:
                     print(f'Stop criterion of Δf ≤ {stop_criterion} kN reached at iteration step {iter_number}!')
                     self.iter_break_number = iter_number
                     self.node_equilibrium_nonlinear = node_equilibrium
                     break
 
+                # Calculate additional displacements
+                if newton_raphson:
+                    displacements_step = np.linalg.solve(self.k_sys, self.f_vec_mismatch)
+                else:
+                    displacements_step = lu_solve(k_sys_lu, self.f_vec_mismatch)
+                # Backtracking line search: halve the step length λ until the residual norm decreases sufficiently
+                # (Armijo condition ‖R(u + λΔu)‖ ≤ (1 - 10⁻⁴λ)‖R(u)‖). If no step length below 10⁻⁸ decreases the
+                # residual the full Newton step is taken like without the line search.
+                residual_norm = np.linalg.norm(self.f_vec_mismatch)
+                step_length = 1.
+                while True:
+                    trial_residual = self.nonlinear_residual(
+                        self.displacements + displacements_cor + step_length * displacements_step, rows_to_zero,
+                        *material)
+                    if step_length == 1.:
+                        full_step_residual = trial_residual
+                    if np.linalg.norm(trial_residual[3]) <= (1 - 1e-4 * step_length) * residual_norm:
+                        break
+                    step_length *= 0.5
+                    if step_length < 1e-8:
+                        step_length, trial_residual = 1., full_step_residual
+                        break
+                residual = trial_residual
+                # Largest displacement of the undamped Newton step in mm for the optional stop criterion Δu
+                step_max = np.abs(displacements_step).max() * 1000
+                displacements_step = step_length * displacements_step
                 # Calculate total displacement
-                displacements_cor = displacements_cor + np.linalg.solve(self.k_sys, self.f_vec_mismatch)
+                displacements_cor = displacements_cor + displacements_step
                 self.displacements_cor_total = self.displacements + displacements_cor
                 # Update strain and axial forces
-                for i in range(len(self.element_matrices)):
-                    self.displacements_local[i] = (np.transpose(self.element_matrices[i]['transformation_matrix'])
-                                                   @ self.displacements_cor_total[self.element_matrices[i]['DOFs']])
-                    strain[i] = ((self.displacements_local[i][2] - self.displacements_local[i][0])
-                                 / self.element_matrices[i]['length'])
-                self.axial_forces_cor = np.array(sigma(strain, ele_lin_coeff, ele_quad_coeff, ele_e, ele_eps_f)
-                                                 * ele_area)
+                strain, self.axial_forces_cor = residual[:2]
                 self.strains_nonlinear = strain
+                # Optional second stop criterion on the largest displacement of the Newton step in mm, it does not
+                # depend on the size of the loads like Δf (older inputs without 'delta_u_max' only use Δf). A step
+                # damped by the line search is only accepted as converged if the residual also meets Δf.
+                if (0 < step_criterion and step_max <= step_criterion
+                        and (step_length == 1. or np.abs(residual[3]).max() <= stop_criterion)):
+                    print(f'Stop criterion of Δu ≤ {step_criterion} mm reached at iteration step {iter_number}!')
+                    self.iter_break_number = iter_number
+                    # Equilibrium of the accepted step, the same state as the returned displacements and forces
+                    node_equilibrium, self.f_vec_mismatch = residual[2:]
+                    self.node_equilibrium_nonlinear = node_equilibrium
+                    self.step_max = round(float(step_max), 4)
+                    break
                 if iter_number == self.calc_param['number_of_iterations']:
                     print(f'Maximum number of {iter_number} iterations reached without meeting the stop criterion'
                           f' Δf ≤ {stop_criterion} kN!')
@@ -348,14 +437,15 @@ class Calculation:
         elif 'NR' in self.calc_param['calc_method'] or 'modNR' in self.calc_param['calc_method'] and sum(
                 ele_quad_coeff) == 0:
             self.axial_forces_cor = self.axial_forces
+            self.displacements_cor_total = self.displacements
             print(f'Attention: You selected a nonlinear Newton-Raphson calculation, '
                   f'but you set the nonlinear parameter β of all elements to 0! Calculating linear...')
         elif 'linear' in self.calc_param['calc_method'] and sum(ele_quad_coeff) != 0:
             print(f'Attention: You selected a linear calculation, '
                   f'but you set the nonlinear parameter β of at least one element not to 0! Calculating linear...')
-        # Flatten the list of lists into a single list and change shape of cor_displacements
+        # Flatten the axial forces (one entry per element, zero forces included) and change shape of cor_displacements
         if self.axial_forces_cor is not None:
-            self.axial_forces_cor = [force[0] for force in self.axial_forces_cor if force]
+            self.axial_forces_cor = np.ravel(self.axial_forces_cor)
             self.displacements_cor_total = self.displacements_cor_total.reshape(-1, 2)
         # Round output
         self.axial_forces = np.round(self.axial_forces, 2)
@@ -378,55 +468,56 @@ class Calculation:
                          'node_equilibrium_nonlinear': self.node_equilibrium_nonlinear,
                          'node_forces_mismatch': self.f_vec_mismatch,
                          'iteration_break_number': self.iter_break_number,
+                         'step_max': self.step_max,
                          'error_linalg': self.e_linalg}
 
 
 # Example for testing and debugging
 if __name__ == "__main__":
-    elements = {'0': {'ele_number': 0,
-                      'ele_node_i': (0., 4.),
-                      'ele_node_j': (4., 4.),
-                      'ele_A': 2000.,
-                      'ele_E': 30000.,
-                      'ele_lin_coeff': 1.,
-                      'ele_quad_coeff': 0.,
-                      'ele_eps_f': 2.5e-3},
-                '1': {'ele_number': 1,
-                      'ele_node_i': (0., 0.),
-                      'ele_node_j': (4., 4.),
-                      'ele_A': 500.,
-                      'ele_E': 30000.,
-                      'ele_lin_coeff': 1.,
-                      'ele_quad_coeff': 200.,
-                      'ele_eps_f': 2.5e-3},
-                '2': {'ele_number': 2,
-                      'ele_node_i': (4., 4.),
-                      'ele_node_j': (5., 0.),
-                      'ele_A': 500.,
-                      'ele_E': 30000.,
-                      'ele_lin_coeff': 1.,
-                      'ele_quad_coeff': 200.,
-                      'ele_eps_f': 2.5e-3},
+    elements = {0: {'ele_number': 0,
+                    'ele_node_i': (0., 4.),
+                    'ele_node_j': (4., 4.),
+                    'ele_A': 2000.,
+                    'ele_E': 30000.,
+                    'ele_lin_coeff': 1.,
+                    'ele_quad_coeff': 0.,
+                    'ele_eps_f': 2.5e-3},
+                1: {'ele_number': 1,
+                    'ele_node_i': (0., 0.),
+                    'ele_node_j': (4., 4.),
+                    'ele_A': 500.,
+                    'ele_E': 30000.,
+                    'ele_lin_coeff': 1.,
+                    'ele_quad_coeff': 200.,
+                    'ele_eps_f': 2.5e-3},
+                2: {'ele_number': 2,
+                    'ele_node_i': (4., 4.),
+                    'ele_node_j': (5., 0.),
+                    'ele_A': 500.,
+                    'ele_E': 30000.,
+                    'ele_lin_coeff': 1.,
+                    'ele_quad_coeff': 200.,
+                    'ele_eps_f': 2.5e-3},
                 }
 
-    supports = {'0': {'sup_number': 0,
-                      'sup_node': (0., 4.),
-                      'c_x': 1.,
-                      'c_y': 1.},
-                '1': {'sup_number': 1,
-                      'sup_node': (0., 0.),
-                      'c_x': 1.,
-                      'c_y': 1.},
-                '2': {'sup_number': 2,
-                      'sup_node': (5., 0.),
-                      'c_x': 1.,
-                      'c_y': 1.}
+    supports = {0: {'sup_number': 0,
+                    'sup_node': (0., 4.),
+                    'c_x': 1.,
+                    'c_y': 1.},
+                1: {'sup_number': 1,
+                    'sup_node': (0., 0.),
+                    'c_x': 1.,
+                    'c_y': 1.},
+                2: {'sup_number': 2,
+                    'sup_node': (5., 0.),
+                    'c_x': 1.,
+                    'c_y': 1.}
                 }
 
-    forces = {'0': {'force_number': 0,
-                    'force_node': (4., 4.),
-                    'f_x': 0.,
-                    'f_y': 1200.}}
+    forces = {0: {'force_number': 0,
+                  'force_node': (4., 4.),
+                  'f_x': 0.,
+                  'f_y': 1200.}}
 
     calc_param = {'calc_method': 'NR',
                   'number_of_iterations': 2,
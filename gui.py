@@ -25,16 +25,23 @@ Main file for starting GUI
 
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
+import tkinter.font as tkfont
 import numpy as np
 from gui_settings import GUI_Settings
-import copy
-from calculation import Calculation
 import json
-import pyautogui
-from PIL import ImageTk, Image
-import base64
-from io import BytesIO
+import logging
+import re
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, asdict
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
 import webbrowser
+# orjson is optional, without it the input files are written and read with the json module
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 #################################################
 # Other
@@ -44,6 +51,38 @@ VERSION_MINOR = 0
 VERSION_PATCH = 0
 RELEASE_DATE = '27.01.2024'
 CONTACT = 'info@pum-consulting.de'
+# Console output of the GUI, debug messages are skipped at the default level without formatting them
+logger = logging.getLogger(__name__)
+# Coordinate input as x,y or [x, y] or (x, y), compiled once for all entry parsing
+NUMBER_PATTERN = r'([-+]?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?)'
+COORDINATE_PATTERN = re.compile(rf'\s*[(\[]?\s*{NUMBER_PATTERN}\s*,\s*{NUMBER_PATTERN}\s*[)\]]?\s*$')
+
+
+# Raised by parse_coordinates, the caller decides how the invalid input is reported
+class CoordinateError(ValueError):
+    pass
+
+
+# Raised by parse_number for text that is no number, the message names the input field
+class NumberError(ValueError):
+    pass
+
+
+def parse_number(text, name):
+    try:
+        return float(text)
+    except ValueError:
+        raise NumberError(f"Value of {name} is not a number! Please check the input '{text}'.") from None
+
+
+# Cached, the same node coordinates are entered for many elements and validated on every typing pause
+@lru_cache(maxsize=512)
+def parse_coordinates(coord_str: str) -> tuple[float, float]:
+    # One match of the compiled pattern instead of stripping and splitting the string
+    match = COORDINATE_PATTERN.match(coord_str)
+    if not match:
+        raise CoordinateError("Invalid coordinate format. Please enter as x,y or [x, y] or (x, y)!")
+    return float(match[1]), float(match[2])
 
 
 #################################################
@@ -53,10 +92,31 @@ CONTACT = 'info@pum-consulting.de'
 def set_icon(root):
     """
     Creates Icon from raw byte data to not need external files for creating .exe
+    The icon is set as default for all toplevel windows of the root, PIL is only imported when it is needed
     :return:
     """
-    icon_image = ImageTk.PhotoImage(data=GUI_Settings.return_icon_bytestring())
-    root.tk.call('wm', 'iconphoto', root._w, icon_image)
+    icon_data = GUI_Settings.return_icon_bytestring()
+    if icon_data:
+        from PIL import ImageTk
+        icon_image = ImageTk.PhotoImage(data=icon_data, master=root)
+        root.tk.call('wm', 'iconphoto', root._w, '-default', icon_image)
+
+
+def entry_float(entry, name, default=None):
+    # Number in an entry box, read and converted once, the default for an empty box
+    text = entry.get()
+    return parse_number(text, name) if text else default
+
+
+def clear_entries(*entries):
+    # Empties the entry boxes of an input form in one pass
+    for entry in entries:
+        entry.delete(0, 'end')
+
+
+def element_nodes_key(node_i, node_j):
+    # Key of the duplicate element check, independent of the direction of the element
+    return (node_i, node_j) if node_i <= node_j else (node_j, node_i)
 
 
 def center_window(window, width, height):
@@ -71,6 +131,236 @@ def center_window(window, width, height):
     window.geometry(f'{width}x{height}+{x}+{y}')
 
 
+def reuse_window(window):
+    # Show a withdrawn window again, returns False if the window still has to be built
+    if window is None or not window.winfo_exists():
+        return False
+    window.deiconify()
+    window.lift()
+    return True
+
+
+def delete_records(records, positions):
+    # Delete the records at the given positions in place, the numbers of the following records are their new positions
+    removed = set(positions)
+    if not removed:
+        return
+    first = min(removed)
+    if len(removed) == 1:
+        # A single record is removed by the list itself, without rebuilding the following part
+        del records[first]
+        return
+    records[first:] = [record for position, record in enumerate(records[first:], start=first)
+                       if position not in removed]
+
+
+def resize_display_values(values, label, count):
+    # The entries only depend on the position, so existing entries are kept and only the difference is formatted
+    del values[count:]
+    values.extend(f"{label} {number}" for number in range(len(values), count))
+    return values
+
+
+def warm_up_solver():
+    # Imports the solver with SciPy in the worker thread and runs it once, the main thread builds the GUI meanwhile
+    from calculation import warm_up
+    warm_up()
+
+
+def record_arrays(elements, supports, forces):
+    # Snapshot of the input records as arrays in the row format of calculation.input_arrays
+    # The worker thread only reads these arrays, so later edits of the input do not reach it
+    element_array = np.array([(*ele.ele_node_i, *ele.ele_node_j, ele.ele_A, ele.ele_E, ele.ele_lin_coeff,
+                               ele.ele_quad_coeff, ele.ele_eps_f) for ele in elements],
+                             dtype=np.float64).reshape(-1, 9)
+    support_array = np.array([(*sup.sup_node, np.inf if sup.c_x == '∞' else sup.c_x,
+                               np.inf if sup.c_y == '∞' else sup.c_y) for sup in supports],
+                             dtype=np.float64).reshape(-1, 4)
+    force_array = np.array([(*force.force_node, force.f_x, force.f_y) for force in forces],
+                           dtype=np.float64).reshape(-1, 4)
+    return element_array, support_array, force_array
+
+
+def numbered_records(records, number_key):
+    # Records keyed by their number with the number field of the file format, the stored records only have positions
+    return {number: {number_key: number, **asdict(record)} for number, record in enumerate(records)}
+
+
+def records_from_file(records, record_type, number_key):
+    # Records of a file section in file order without the number field, the node lists of JSON become tuples again
+    return [record_type(**{key: tuple(value) if isinstance(value, list) else value
+                           for key, value in record.items() if key != number_key})
+            for record in records.values()]
+
+
+def write_input_file(file_path, data):
+    # The record numbers are integer keys and the record values may be NumPy floats
+    if orjson is not None:
+        with open(file_path, 'wb') as file:
+            file.write(orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+                                    | orjson.OPT_SERIALIZE_NUMPY))
+    else:
+        with open(file_path, 'w') as file:
+            json.dump(data, file, indent=4)
+
+
+def read_input_file(file_path):
+    if orjson is not None:
+        with open(file_path, 'rb') as file:
+            return orjson.loads(file.read())
+    with open(file_path, 'r') as file:
+        return json.load(file)
+
+
+def support_outlines(x, y, c_x, c_y):
+    # Point lists of the lines of a support symbol at the canvas position (x, y), in drawing order
+    dxy = 29  # Defines the size of the plotted support
+    s_dx = 20
+    s_dy = 15
+    s_hline_dxy = 10
+    dxy_hline = 36  # Defines the size of the horizontal line of the sliding supports
+    triangle_down = [(x, y), (x - dxy, y + dxy), (x + dxy, y + dxy), (x, y)]
+    # Triangle and sliding line of the rigid directions, keyed by (rigid in x, rigid in y)
+    outlines = {(True, True): [triangle_down],
+                (True, False): [[(x + dxy_hline, y - dxy_hline), (x + dxy_hline, y + dxy_hline)],
+                                [(x, y), (x + dxy, y - dxy), (x + dxy, y + dxy), (x, y)]],
+                (False, True): [[(x - dxy_hline, y + dxy_hline), (x + dxy_hline, y + dxy_hline)], triangle_down],
+                (False, False): []}[c_x == '∞', c_y == '∞']
+    # Support elastic in y-direction: ground line and spring below the node
+    if c_y != '∞' and c_y > 0:
+        outlines += [[(x - s_dx / 2 - s_hline_dxy, y + 2.5 * s_dy + s_hline_dxy / 2),
+                      (x + s_dx / 2 + s_hline_dxy, y + 2.5 * s_dy + s_hline_dxy / 2)],
+                     [(x, y), (x + s_dx / 2, y + s_dy / 2), (x - s_dx / 2, y + s_dy), (x + s_dx / 2, y + 1.5 * s_dy),
+                      (x - s_dx / 2, y + 2 * s_dy), (x + s_dx / 2, y + 2.5 * s_dy), (x - s_dx / 2, y + 2.5 * s_dy)]]
+    # Support elastic in x-direction: ground line and spring right of the node
+    if c_x != '∞' and c_x > 0:
+        outlines += [[(x + 2.5 * s_dy + s_hline_dxy / 2, y - s_dx / 2 - s_hline_dxy),
+                      (x + 2.5 * s_dy + s_hline_dxy / 2, y + s_dx / 2 + s_hline_dxy)],
+                     [(x, y), (x + s_dy / 2, y + s_dx / 2), (x + s_dy, y - s_dx / 2), (x + 1.5 * s_dy, y + s_dx / 2),
+                      (x + 2 * s_dy, y - s_dx / 2), (x + 2.5 * s_dy, y + s_dx / 2), (x + 2.5 * s_dy, y - s_dx / 2)]]
+    return outlines
+
+
+def displacement_information(calculation, displacements):
+    # Text block of the node displacements in mm, converted and rounded for all nodes at once
+    displacements_mm = np.asarray(displacements).reshape(-1, 2) * 1000
+    u_mm = np.round(displacements_mm[:, 0], 3).tolist()
+    w_mm = np.round(displacements_mm[:, 1], 2).tolist()
+    return f"\nNode Displacements ({calculation} Calculation):\n" + "".join(
+        f"Node {node}: u = {u} mm, w = {w} mm.\n" for node, (u, w) in enumerate(zip(u_mm, w_mm)))
+
+
+def axial_force_information(calculation, axial_forces):
+    # Text block of the axial forces in kN
+    return f"\nAxial Forces ({calculation} Calculation):\n" + "".join(
+        f"Element {element}: N = {force} kN.\n" for element, force in enumerate(axial_forces))
+
+
+def changed_line_range(old_lines, new_lines):
+    # Skip the unchanged leading and trailing lines, returns the start and the ends of the changed old and new lines
+    start = 0
+    common = min(len(old_lines), len(new_lines))
+    while start < common and old_lines[start] == new_lines[start]:
+        start += 1
+    end = 0
+    while end < common - start and old_lines[-1 - end] == new_lines[-1 - end]:
+        end += 1
+    return start, len(old_lines) - end, len(new_lines) - end
+
+
+@contextmanager
+def editable_text(widget):
+    # Enable a read-only text widget for the duration of the block, the redraw happens once when idle
+    widget.config(state='normal')
+    try:
+        yield widget
+    finally:
+        widget.config(state='disabled')
+
+
+# Input records, the field names are the keys of the saved files
+@dataclass(slots=True)
+class ElementRecord:
+    ele_node_i: tuple[float, float]
+    ele_node_j: tuple[float, float]
+    ele_A: float
+    ele_E: float
+    ele_lin_coeff: float
+    ele_quad_coeff: float
+    ele_eps_f: float
+
+
+@dataclass(slots=True)
+class SupportRecord:
+    sup_node: tuple[float, float]
+    c_x: float | str
+    c_y: float | str
+
+
+@dataclass(slots=True)
+class LoadRecord:
+    force_node: tuple[float, float]
+    f_x: float
+    f_y: float
+
+
+# Initial input parameters, built as new literals on every call instead of deep copying template dicts
+def new_input_elements():
+    return []
+
+
+def new_input_supports():
+    return []
+
+
+def new_input_forces():
+    return []
+
+
+def new_input_calc_param():
+    return {'calc_method': 'linear',
+            'number_of_iterations': 0,
+            'delta_f_max': 0.,
+            'delta_u_max': 0.}
+
+
+# Input forms as (frame title, rows, buttons), rows are (kind, label text, attribute name, *options) and buttons are
+# (text, command, attribute name or None, state), commands are method names of the main window
+FORM_SPECS = {
+    'elements': ("Define elements",
+                 [('check', "Nonlinear element:", 'element_type', False, 'toggle_element_type'),
+                  ('entry', "Node i (x, y) [m]:", 'node_i_entry'),
+                  ('entry', "Node j (x, y) [m]:", 'node_j_entry'),
+                  ('entry', "Cross-section area A [cm²]:", 'area_entry'),
+                  ('entry', "Young's modulus E [MPa]:", 'emod_entry'),
+                  ('entry', "Linear coefficient α [-]:", 'lin_coeff_entry'),
+                  ('entry', "Quadratic coefficient β [-]:", 'quad_coeff_entry'),
+                  ('entry', "Limit strain ε_y [-]:", 'strain_entry')],
+                 [("Edit/Delete Element", 'edit_element', 'edit_element_button', 'disabled'),
+                  ("Add Element", 'add_element', None, 'normal')]),
+    'supports': ("Define Supports",
+                 [('combobox', "Support Node (x, y) [m]:", 'support_node_entry'),
+                  ('check', "Rigid in x-direction:", 'support_rigid_cx', True, 'toggle_stiffness_cx'),
+                  ('check', "Rigid in y-direction:", 'support_rigid_cy', True, 'toggle_stiffness_cy'),
+                  ('entry', "Stiffness c_x [kN/m]:", 'stiffness_cx_entry'),
+                  ('entry', "Stiffness c_y [kN/m]:", 'stiffness_cy_entry')],
+                 [("Edit/Delete Support", 'edit_support', 'edit_support_button', 'disabled'),
+                  ("Add Support", 'add_support', 'add_support_button', 'disabled')]),
+    'loads': ("Define Loads",
+              [('combobox', "Force Node (x, y) [m]:", 'force_node_entry'),
+               ('entry', "Force F_x [kN]:", 'force_x_entry'),
+               ('entry', "Force F_y [kN]:", 'force_y_entry')],
+              [("Edit/Delete Load", 'edit_load', 'edit_load_button', 'disabled'),
+               ("Add Load", 'add_load', 'add_load_button', 'disabled')]),
+    'calc': ("Calculation Settings",
+             [('combobox', "Select method:", 'method_combobox', ["Linear", "Newton-Raphson", "Mod. Newton-Raphson"]),
+              ('entry', "Max. number of iterations [-]:", 'num_iterations_entry'),
+              ('entry', "Max. deviation ΔF_max [kN]:", 'delta_f_entry'),
+              ('entry', "Max. step Δu_max [mm] (optional):", 'delta_u_entry')],
+             [("Save Settings", 'calc_settings', None, 'normal')])
+}
+
+
 # Splash screen duration and progress bar update interval in milliseconds
 SPLASH_TIME = 3000
 
@@ -80,10 +370,8 @@ set_icon(splash_root)
 splash_root.title("Truss FEM - Nonlinear Truss Structure Analysis")
 splash_root.geometry("512x512")  # Set your desired size
 center_window(splash_root, 512, 512)
-# Convert base64 string to PIL Image
-image_data = base64.b64decode(GUI_Settings.return_splashimage_base64())
-logo_image = Image.open(BytesIO(image_data))
-logo_photo = ImageTk.PhotoImage(logo_image)
+# Create image from base64 PNG string, Tk decodes PNG data natively
+logo_photo = tk.PhotoImage(master=splash_root, data=GUI_Settings.return_splashimage_base64())
 
 # Create and pack a label with the logo image
 logo_label = tk.Label(splash_root, image=logo_photo)
@@ -115,33 +403,17 @@ class TrussAnalysisApp(tk.Tk):
         super().__init__()
         set_icon(self)
         self.solution = None
+        # The solver runs in a worker thread, its pending result is polled from the Tk event loop
+        self.calculation_executor = ThreadPoolExecutor(max_workers=1)
+        self.calculation_future = None
+        # Load the solver routines in the worker thread while the GUI is built, the first calculation starts faster
+        self.calculation_executor.submit(warm_up_solver)
+        self.protocol("WM_DELETE_WINDOW", self.close_window)
         # Set title of main window
         self.title("Truss FEM - Nonlinear Truss Structure Analysis")
-        # Initialise main window
+        # Initialise main window, hidden while the widgets are created so the layout is only computed once
+        self.withdraw()
         self.init_ui()
-        self.input_elements_init = {'0': {'ele_number': 0,
-                                          'ele_node_i': (0., 0.),
-                                          'ele_node_j': (0., 0.),
-                                          'ele_A': 0.,
-                                          'ele_E': 0.,
-                                          'ele_lin_coeff': 0.,
-                                          'ele_quad_coeff': 0.,
-                                          'ele_eps_f': 0.}}
-
-        self.input_supports_init = {'0': {'sup_number': 0,
-                                          'sup_node': (0., 0.),
-                                          'c_x': 0.,
-                                          'c_y': 0.}}
-
-        self.input_forces_init = {'0': {'force_number': 0,
-                                        'force_node': (0., 0.),
-                                        'f_x': 0.,
-                                        'f_y': 0.}}
-
-        self.input_calc_param_init = {'calc_method': 'linear',
-                                      'number_of_iterations': 0,
-                                      'delta_f_max': 0.}
-
         self.method_dict = {'Linear': 'linear',
                             'Newton-Raphson': 'NR',
                             'Mod. Newton-Raphson': 'modNR'}
@@ -151,9 +423,6 @@ class TrussAnalysisApp(tk.Tk):
                                     'modNR': 'Mod. Newton-Raphson'}
         self.methods = ('linear', 'NR', 'modNR')
 
-        self.ele_number = 0
-        self.force_number = 0
-        self.support_number = 0
         self.add_element_initialise = 0
         self.add_support_initialise = 0
         self.add_load_initialise = 0
@@ -166,16 +435,51 @@ class TrussAnalysisApp(tk.Tk):
         self.nonlinear_displacement = None
         self.nodes = []
         self.header_text = []
-        self.input_elements = copy.deepcopy(self.input_elements_init)
-        self.input_supports = copy.deepcopy(self.input_supports_init)
-        self.input_forces = copy.deepcopy(self.input_forces_init)
-        self.input_calc_param = copy.deepcopy(self.input_calc_param_init)
+        # Entries of the edit window dropdowns, only grown or shortened to the number of records
+        self.element_display_values = []
+        self.load_display_values = []
+        self.support_display_values = []
+        # Edit windows are built once and withdrawn instead of destroyed when closed
+        self.edit_window = None
+        self.edit_window_load = None
+        self.edit_window_support = None
+        # Pending redraw of the canvas, time of the last redraw and the refreshes run for every change of the input
+        self.canvas_redraw_job = None
+        self.canvas_redraw_time = 0.0
+        self.change_subscribers = [self.reset_view, self.discard_pending_calculation,
+                                   self.schedule_system_information_update, self.schedule_canvas_redraw]
+        # Pending idle refresh of the system information and depth of nested batched updates
+        self.system_information_job = None
+        self.system_information_dirty = False
+        self.batch_depth = 0
+        # Version counters of the system information sections and the last rendered (version, lines, length) per section
+        self.section_versions = {'elements': 0, 'supports': 0, 'loads': 0, 'calc': 0}
+        self.section_cache = None
+        self.input_elements = new_input_elements()
+        self.input_supports = new_input_supports()
+        self.input_forces = new_input_forces()
+        self.input_calc_param = new_input_calc_param()
+        # Lookups for the duplicate checks of elements, supports and loads
+        self.update_lookup_tables()
+        # Show the main window with the finished layout
+        self.update_idletasks()
+        self.deiconify()
 
     def init_ui(self):
-        # Adjust the size
-        self.geometry(f"{GUI_Settings.screensize[0]}x{GUI_Settings.screensize[1]}")
+        # Adjust the size, the geometry is set once by center_window
+        window_width, window_height = GUI_Settings.screensize
         self.resizable(False, False)
-        center_window(self, GUI_Settings.screensize[0], GUI_Settings.screensize[1])
+        center_window(self, window_width, window_height)
+
+        # Style for entry boxes with invalid content and pending validation jobs of the entry boxes
+        ttk.Style(self).configure('Invalid.TEntry', foreground='red')
+        # Named fonts created once, labels and canvas items refer to them by name instead of parsing the font spec
+        self.header_font = tkfont.Font(self, font=GUI_Settings.FRAME_HEADER_FONT)
+        self.standard_font = tkfont.Font(self, font=GUI_Settings.STANDARD_FONT_1)
+        self.small_font = tkfont.Font(self, font=GUI_Settings.STANDARD_FONT_2)
+        self.italic_font = tkfont.Font(self, font=GUI_Settings.ITALIC_FONT_1)
+        self.results_font = tkfont.Font(self, font=GUI_Settings.RESULTS_FONT_1)
+        self.validate_jobs = {}
 
         # Main frame for forms
         main_frame = ttk.Frame(self)
@@ -217,8 +521,9 @@ class TrussAnalysisApp(tk.Tk):
         separator1.pack(fill='x', padx=10, pady=5)
 
         # Initialize forms for input parameters
-        input_param_text = tk.Label(main_frame, text="Input parameters", font=GUI_Settings.FRAME_HEADER_FONT)
+        input_param_text = tk.Label(main_frame, text="Input parameters", font=self.header_font)
         input_param_text.pack(anchor='nw')
+        # All forms are built while the main window is withdrawn, it is shown once with the finished layout
         self.add_elements_form(main_frame)
         self.add_supports_form(main_frame)
         self.add_loads_form(main_frame)
@@ -236,12 +541,21 @@ class TrussAnalysisApp(tk.Tk):
         separator1.pack(fill='x', padx=10, pady=5)
 
         # Canvas for displaying results
-        canvas_text = tk.Label(canvas_frame, text="System and results", font=GUI_Settings.FRAME_HEADER_FONT)
+        canvas_text = tk.Label(canvas_frame, text="System and results", font=self.header_font)
         canvas_text.place(relx=0.02, rely=0.014)
-        self.canvas = tk.Canvas(canvas_frame, width=round(GUI_Settings.screensize[0] * 0.62),
-                                height=round(GUI_Settings.screensize[1] * 0.7),
+        self.canvas = tk.Canvas(canvas_frame, width=round(window_width * 0.62),
+                                height=round(window_height * 0.7),
                                 bg=GUI_Settings.CANVAS_BG, highlightbackground="black", highlightthickness=1)
         self.canvas.place(relx=0.02, rely=0.04)
+        # Size of the canvas, only queried from Tk again when the canvas is resized
+        self.canvas_size = (self.canvas.winfo_width(), self.canvas.winfo_height())
+        self.canvas.bind('<Configure>', self.on_canvas_resize)
+        # Scale and translation of the view with the canvas size they belong to, reset when the elements change
+        self.view_cache = None
+        # Canvas item ids (line, hinge i, hinge j) of the drawn elements, reused on every redraw
+        self.element_items = {}
+        # Canvas item ids of the deformed elements, moved instead of recreated when the deformation is plotted again
+        self.deformation_items = {}
 
         # Frame for system information and scrollbar
         sys_info_frame = tk.Frame(self)
@@ -249,14 +563,16 @@ class TrussAnalysisApp(tk.Tk):
 
         # Text widget for system information
         current_system_information_label = tk.Label(self, text="System Information:",
-                                                    font=GUI_Settings.FRAME_HEADER_FONT)
+                                                    font=self.header_font)
         current_system_information_label.place(relx=0.215, rely=0.76)
         initial_system_information = f"Information about the system parameters will be displayed here."
         self.current_system_information = tk.Text(sys_info_frame, wrap=tk.WORD,
-                                                  font=GUI_Settings.STANDARD_FONT_2, bg='light gray', fg='black')
+                                                  font=self.small_font, bg='light gray', fg='black')
         self.current_system_information.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
         self.current_system_information.insert(tk.END, initial_system_information)
         self.current_system_information.config(state='disabled')
+        # Refreshes requested while the text widget was not shown are run once it is mapped
+        self.current_system_information.bind('<Map>', lambda event: self.queue_system_information_update())
 
         # Scrollbar for the Text widget
         scrollbar_systeminfo = tk.Scrollbar(sys_info_frame, orient='vertical',
@@ -272,11 +588,11 @@ class TrussAnalysisApp(tk.Tk):
 
         # Text widget for calculation information
         calculation_information_label = tk.Label(self, text="Calculation Information:",
-                                                 font=GUI_Settings.FRAME_HEADER_FONT)
+                                                 font=self.header_font)
         calculation_information_label.place(relx=0.64, rely=0.76)
         initial_calculation_information = f"Information about the calculation will be displayed here."
         self.current_calculation_information = tk.Text(calc_info_frame, wrap=tk.WORD,
-                                                       font=GUI_Settings.STANDARD_FONT_2, bg='light gray', fg='black')
+                                                       font=self.small_font, bg='light gray', fg='black')
         self.current_calculation_information.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
         self.current_calculation_information.insert(tk.END, initial_calculation_information)
         self.current_calculation_information.config(state='disabled')
@@ -315,7 +631,7 @@ class TrussAnalysisApp(tk.Tk):
         separator12.pack(fill='x', padx=10, pady=5)
 
         # Label Plot Options
-        plot_options_text = tk.Label(plot_options_frame, text="Plot options", font=GUI_Settings.FRAME_HEADER_FONT)
+        plot_options_text = tk.Label(plot_options_frame, text="Plot options", font=self.header_font)
         plot_options_text.pack(anchor='nw')
 
         # Create Frame for plotting the system
@@ -351,7 +667,7 @@ class TrussAnalysisApp(tk.Tk):
         self.plot_button = ttk.Button(plot_system_frame, text="Plot system", command=self.plot_system, state='disabled')
         self.plot_button.grid(row=5, column=0, columnspan=2, pady=5, padx=10, sticky='ew')
         # Label Plot Results
-        plot_results_text = tk.Label(plot_options_frame, text="Plot results", font=GUI_Settings.FRAME_HEADER_FONT)
+        plot_results_text = tk.Label(plot_options_frame, text="Plot results", font=self.header_font)
         plot_results_text.pack(anchor='nw')
         # Create Frame for plotting the results of the linear calculation
         plot_linear_frame = ttk.LabelFrame(plot_options_frame, text='Linear calculation')
@@ -395,18 +711,10 @@ class TrussAnalysisApp(tk.Tk):
         self.after(100, self.toggle_grid)  # 100 milliseconds delay
 
         # Add coordinate system to canvas
-        # Define starting point (top-left corner with some padding)
-        start_x, start_y = 10, 10
-        # Length of the arrows
-        arrow_length = 40
-        # Draw x-axis arrow
-        self.canvas.create_line(start_x, start_y, start_x + arrow_length, start_y, arrow=tk.LAST)
-        self.canvas.create_text(start_x + arrow_length - 5, start_y + 8, text="x", anchor="center", width=1.5,
-                                font=GUI_Settings.ITALIC_FONT_1)
-        # Draw y-axis arrow
-        self.canvas.create_line(start_x, start_y, start_x, start_y + arrow_length, arrow=tk.LAST)
-        self.canvas.create_text(start_x + 12, start_y + arrow_length - 8, text="y", anchor="center", width=1.5,
-                                font=GUI_Settings.ITALIC_FONT_1)
+        self.draw_coordinate_system()
+
+    def on_canvas_resize(self, event):
+        self.canvas_size = (event.width, event.height)
 
     def toggle_run_calculation_button(self):
         if self.add_element_initialise == 1 and self.add_load_initialise == 1 and self.add_support_initialise == 1:
@@ -415,8 +723,8 @@ class TrussAnalysisApp(tk.Tk):
             self.run_calculation_button.config(state='disabled')
 
     def draw_grid(self):
-        canvas_width = self.canvas.winfo_width()
-        canvas_height = self.canvas.winfo_height()
+        from PIL import Image, ImageDraw, ImageTk
+        canvas_width, canvas_height = self.canvas_size
         scale, translate_x, translate_y, max_dimension = self.calculate_bounds_and_scale()
         center_x, center_y = self.scale_and_translate(0, 0)
         range_m = 100  # +/- range in meters
@@ -439,23 +747,25 @@ class TrussAnalysisApp(tk.Tk):
             grid_spacing = grid_spacing_init
         tick_length = 10  # Length of the ticks
 
+        # Grid lines and ticks are rasterized into one transparent image instead of single canvas items
+        grid_image = Image.new('RGBA', (canvas_width, canvas_height), (0, 0, 0, 0))
+        grid_draw = ImageDraw.Draw(grid_image)
+
         # Draw grid lines, labels, and ticks
         for i in range(-range_m, range_m + 1):
             offset = i * grid_spacing
 
             # Horizontal grid lines and ticks
             x = center_x + offset
-            self.canvas.create_line(x, 0, x, canvas_height, fill='gray', tags='grid_line')
-            self.canvas.create_line(x - offset / 2, 0, x - offset / 2, canvas_height, fill='gray79', tags='grid_line')
-            self.canvas.create_line(x, center_y - tick_length // 2, x, center_y + tick_length // 2, fill='black',
-                                    tags='grid_tick', width=2)
+            grid_draw.line((x, 0, x, canvas_height), fill=GUI_Settings.GRID_COLOR)
+            grid_draw.line((x - offset / 2, 0, x - offset / 2, canvas_height), fill=GUI_Settings.GRID_MINOR_COLOR)
+            grid_draw.line((x, center_y - tick_length // 2, x, center_y + tick_length // 2), fill='black', width=2)
 
             # Vertical grid lines and ticks
             y = center_y + offset
-            self.canvas.create_line(0, y, canvas_width, y, fill='gray', tags='grid_line')
-            self.canvas.create_line(0, y - offset / 2, canvas_width, y - offset / 2, fill='gray79', tags='grid_line')
-            self.canvas.create_line(center_x - tick_length // 2, y, center_x + tick_length // 2, y, fill='black',
-                                    tags='grid_tick', width=2)
+            grid_draw.line((0, y, canvas_width, y), fill=GUI_Settings.GRID_COLOR)
+            grid_draw.line((0, y - offset / 2, canvas_width, y - offset / 2), fill=GUI_Settings.GRID_MINOR_COLOR)
+            grid_draw.line((center_x - tick_length // 2, y, center_x + tick_length // 2, y), fill='black', width=2)
             # Labels
             self.canvas.create_text(x + 3, center_y + 3, text=f"{i * tick_spacing}m", fill='black',
                                     tags='grid_label', anchor='nw')
@@ -465,14 +775,19 @@ class TrussAnalysisApp(tk.Tk):
                                         tags='grid_label', anchor='nw')
 
         # Draw horizontal and vertical center lines
-        self.canvas.create_line(center_x, 0, center_x, canvas_height, fill='black', tags='grid_line', width=2)
-        self.canvas.create_line(0, center_y, canvas_width, center_y, fill='black', tags='grid_line', width=2)
+        grid_draw.line((center_x, 0, center_x, canvas_height), fill='black', width=2)
+        grid_draw.line((0, center_y, canvas_width, center_y), fill='black', width=2)
+
+        # Place the grid image below the labels, the reference prevents the image from being garbage collected
+        self.grid_image = ImageTk.PhotoImage(grid_image, master=self.canvas)
+        grid_item = self.canvas.create_image(0, 0, image=self.grid_image, anchor='nw', tags='grid_line')
+        self.canvas.tag_lower(grid_item, 'grid_label')
+        self.canvas.tag_raise('axes')
 
     def clear_grid(self):
         # Remove all grid lines and labels
         self.canvas.delete("grid_line")
         self.canvas.delete("grid_label")
-        self.canvas.delete("grid_tick")
 
     def toggle_grid(self):
         if self.show_grid_state.get():
@@ -483,7 +798,6 @@ class TrussAnalysisApp(tk.Tk):
     def display_info(self):
         # Create a top-level window
         info_window = tk.Toplevel(self)
-        set_icon(info_window)
         info_window.geometry('600x300')
         info_window.resizable(False, False)
         center_window(info_window, 600, 300)
@@ -530,7 +844,6 @@ class TrussAnalysisApp(tk.Tk):
     def display_tutorial(self):
         # Create a top-level window
         tutorial_window = tk.Toplevel(self)
-        set_icon(tutorial_window)
         tutorial_window.geometry('600x300')
         tutorial_window.resizable(False, False)
         center_window(tutorial_window, 600, 300)
@@ -565,9 +878,7 @@ class TrussAnalysisApp(tk.Tk):
                           "illustrated in the figure below. Due this circumstance, the input parameters ε_y, α and β "
                           "are not sign sensitive.\n\n")
         # Include image of stress-strain-relationship
-        image_data = base64.b64decode(GUI_Settings.return_stress_strain_base64())
-        stress_strain_photo = Image.open(BytesIO(image_data))
-        stress_strain_photo = ImageTk.PhotoImage(stress_strain_photo)
+        stress_strain_photo = tk.PhotoImage(master=tutorial_window, data=GUI_Settings.return_stress_strain_base64())
         # Further explanation
         tutorial_text3 = ("Due to the non-linear material behavior, a linear calculation results in an imbalance in "
                           "the nodal forces. In order to determine the nodal forces for the equilibrium state, a "
@@ -611,51 +922,154 @@ class TrussAnalysisApp(tk.Tk):
                                                                                     ("JPG files", "*.jpg")])
 
         if filepath:
+            # pyautogui (and PIL with it) is only imported for the export, it is not needed to start the GUI
+            import pyautogui
             screenshot = pyautogui.screenshot(region=(x, y, width, height))
             screenshot.save(filepath)
 
-    def update_system_information(self):
-        info_text = "Current System Information:\n"
+    def notify_changed(self, *sections):
+        # Single channel for changes of the input, every subscriber coalesces its refresh until the GUI is idle
+        for subscriber in self.change_subscribers:
+            subscriber(*sections)
+
+    def reset_view(self, *sections):
+        # The bounds of the view only depend on the elements
+        if not sections or 'elements' in sections:
+            self.view_cache = None
+
+    def discard_pending_calculation(self, *sections):
+        # The result of a running calculation belongs to the changed system, finish_calculation drops it
+        if sections == ('calc',) or self.calculation_future is None:
+            return
+        self.calculation_future = None
+        self.toggle_run_calculation_button()
 
-        # Adding information about elements
-        if self.input_elements and self.add_element_initialise == 1:
-            info_text += "\nElements:\n"
-            for ele in self.input_elements.values():
-                info_text += (
-                    f"Element {ele['ele_number']}: Node i = {ele['ele_node_i']}, Node j = {ele['ele_node_j']},"
-                    f" A = {ele['ele_A']} cm², E = {ele['ele_E']} MPa, α = {ele['ele_lin_coeff']} [-],"
-                    f" β = {ele['ele_quad_coeff']} [-], ε = {ele['ele_eps_f']} [-].\n")
-
-        # Adding information about supports
-        if self.input_supports and self.add_support_initialise == 1:
-            info_text += "\nSupports:\n"
-            for sup in self.input_supports.values():
-                c_x = sup['c_x']
-                c_y = sup['c_y']
-                info_text += (f"Support {sup['sup_number']}: Node = {sup['sup_node']}, c_x = {c_x} kN/m, "
-                              f"c_y = {c_y} kN/m.\n")
-
-        # Adding information about loads
-        if self.input_forces and self.add_load_initialise == 1:
-            info_text += "\nLoads:\n"
-            for load in self.input_forces.values():
-                info_text += (f"Load {load['force_number']}: Node = {load['force_node']}, F_x = {load['f_x']} kN, "
-                              f"F_y = {load['f_y']} kN.\n")
+    def close_window(self):
+        # Do not start queued solver jobs after the window is closed, a running calculation is not waited for
+        self.calculation_executor.shutdown(wait=False, cancel_futures=True)
+        self.destroy()
+
+    def schedule_canvas_redraw(self, *sections):
+        # The calculation parameters are not drawn
+        if sections == ('calc',):
+            return
+        if self.canvas_redraw_job is None:
+            # Changes in quick succession, e.g. by key repeat, wait for the rest of the redraw interval
+            wait = GUI_Settings.CANVAS_REDRAW_INTERVAL - (time.monotonic() - self.canvas_redraw_time) * 1000
+            if wait > 0:
+                self.canvas_redraw_job = self.after(int(wait) + 1, self.run_canvas_redraw)
+            else:
+                self.canvas_redraw_job = self.after_idle(self.run_canvas_redraw)
+
+    def run_canvas_redraw(self):
+        self.canvas_redraw_job = None
+        self.canvas_redraw_time = time.monotonic()
+        self.plot_system()
+
+    def schedule_system_information_update(self, *sections):
+        # Mark the given sections (all if none are given) as changed
+        for section in sections or self.section_versions:
+            self.section_versions[section] += 1
+        self.system_information_dirty = True
+        self.queue_system_information_update()
+
+    def queue_system_information_update(self):
+        # Coalesce all requested updates into a single refresh of the system information once the GUI is idle
+        if self.batch_depth == 0 and self.system_information_job is None:
+            self.system_information_job = self.after_idle(self.run_system_information_update)
+
+    def run_system_information_update(self):
+        self.system_information_job = None
+        # Keep the changes pending while the text widget is not shown, the <Map> binding queues the refresh again
+        if self.system_information_dirty and self.current_system_information.winfo_ismapped():
+            self.system_information_dirty = False
+            self.update_system_information()
+
+    @contextmanager
+    def batched_updates(self):
+        """
+        Reentrant context for bulk changes, the system information is refreshed once after the outermost block
+        :return:
+        """
+        self.batch_depth += 1
+        try:
+            yield
+        finally:
+            self.batch_depth -= 1
+            if self.batch_depth == 0 and self.system_information_dirty:
+                self.queue_system_information_update()
+
+    def system_information_elements(self):
+        # Adding information about elements, one line per element
+        if not (self.input_elements and self.add_element_initialise == 1):
+            return []
+        return ["\nElements:\n"] + [
+            f"Element {number}: Node i = {ele.ele_node_i}, Node j = {ele.ele_node_j},"
+            f" A = {ele.ele_A} cm², E = {ele.ele_E} MPa, α = {ele.ele_lin_coeff} [-],"
+            f" β = {ele.ele_quad_coeff} [-], ε = {ele.ele_eps_f} [-].\n"
+            for number, ele in enumerate(self.input_elements)]
+
+    def system_information_supports(self):
+        # Adding information about supports, one line per support
+        if not (self.input_supports and self.add_support_initialise == 1):
+            return []
+        return ["\nSupports:\n"] + [
+            f"Support {number}: Node = {sup.sup_node}, c_x = {sup.c_x} kN/m, "
+            f"c_y = {sup.c_y} kN/m.\n" for number, sup in enumerate(self.input_supports)]
+
+    def system_information_loads(self):
+        # Adding information about loads, one line per load
+        if not (self.input_forces and self.add_load_initialise == 1):
+            return []
+        return ["\nLoads:\n"] + [
+            f"Load {number}: Node = {load.force_node}, F_x = {load.f_x} kN, "
+            f"F_y = {load.f_y} kN.\n" for number, load in enumerate(self.input_forces)]
+
+    def system_information_calc(self):
         # Adding information about calculation parameters
-        if self.input_calc_param and self.add_calc_initialise == 1:
-            info_text += "\nCalculation Parameters:\n"
-            info_text += f"Method: {self.method_reverse_dict[self.input_calc_param['calc_method']]}, "
-            info_text += f"Iterations: {self.input_calc_param['number_of_iterations']}, "
-            info_text += f"Max node imbalance ΔF = {self.input_calc_param['delta_f_max']} kN.\n"
-
-        # Updating the text widget
-        self.current_system_information.config(state='normal')
-        self.current_system_information.delete(1.0, tk.END)
-        self.current_system_information.insert(tk.END, info_text)
-        self.current_system_information.config(state='disabled')
+        if not (self.input_calc_param and self.add_calc_initialise == 1):
+            return []
+        return ["\nCalculation Parameters:\n",
+                f"Method: {self.method_reverse_dict[self.input_calc_param['calc_method']]}, "
+                f"Iterations: {self.input_calc_param['number_of_iterations']}, "
+                f"Max node imbalance ΔF = {self.input_calc_param['delta_f_max']} kN"
+                + (f", Max step Δu = {delta_u_max} mm.\n" if (delta_u_max := self.input_calc_param.get('delta_u_max'))
+                   else ".\n")]
+
+    def update_system_information(self):
+        info_text = "Current System Information:\n"
+        sections = (('elements', self.system_information_elements),
+                    ('supports', self.system_information_supports),
+                    ('loads', self.system_information_loads),
+                    ('calc', self.system_information_calc))
+
+        with editable_text(self.current_system_information):
+            if self.section_cache is None:
+                # Replace the initial placeholder text, all sections are rendered below
+                self.current_system_information.replace("1.0", "end-1c", info_text)
+                self.section_cache = {}
+
+            # Only re-render the changed sections and replace the character range of their changed lines
+            offset = len(info_text)
+            for section, render_section in sections:
+                version = self.section_versions[section]
+                cached_version, cached_lines, cached_length = self.section_cache.get(section, (None, [], 0))
+                if cached_version != version:
+                    section_lines = render_section()
+                    start, cached_end, section_end = changed_line_range(cached_lines, section_lines)
+                    if start < cached_end or start < section_end:
+                        first = offset + sum(map(len, cached_lines[:start]))
+                        last = first + sum(map(len, cached_lines[start:cached_end]))
+                        self.current_system_information.replace(f"1.0 + {first} chars", f"1.0 + {last} chars",
+                                                                "".join(section_lines[start:section_end]))
+                    cached_length += (sum(map(len, section_lines[start:section_end]))
+                                      - sum(map(len, cached_lines[start:cached_end])))
+                    self.section_cache[section] = (version, section_lines, cached_length)
+                offset += cached_length
 
     def update_calculation_information(self):
-        info_text = "Calculation Results:\n"
+        # Text blocks of the results, joined once before they are inserted
+        info_text = ["Calculation Results:\n"]
         imbalance_info = ""
         info_text_calc = ""
         info_text_strain_nonlinear = ""
@@ -667,90 +1081,81 @@ class TrussAnalysisApp(tk.Tk):
             # Case: Nonlinear calculation
             if self.solution['node_displacements_nonlinear'] is not None:
                 # Node Displacements - Linear Calculation
-                info_text += "\nNode Displacements (Linear Calculation):\n"
-                for node, displacement in enumerate(self.solution['node_displacements_linear']):
-                    info_text += (f"Node {node}: u = {round(displacement[0] * 1000, 3)} mm, w = "
-                                  f"{round(displacement[1] * 1000, 2)} mm.\n")
+                info_text.append(displacement_information('Linear', self.solution['node_displacements_linear']))
 
                 # Node Displacements - Nonlinear Calculation
-                info_text += "\nNode Displacements (Nonlinear Calculation):\n"
-                for node, displacement in enumerate(self.solution['node_displacements_nonlinear']):
-                    info_text += (f"Node {node}: u = {round(displacement[0] * 1000, 3)} mm, w = "
-                                  f"{round(displacement[1] * 1000, 2)} mm.\n")
+                info_text.append(displacement_information('Nonlinear', self.solution['node_displacements_nonlinear']))
 
                 # Axial Forces - Linear Calculation
-                info_text += "\nAxial Forces (Linear Calculation):\n"
-                for element, force in enumerate(self.solution['axial_forces_linear']):
-                    info_text += f"Element {element}: N = {force} kN.\n"
+                info_text.append(axial_force_information('Linear', self.solution['axial_forces_linear']))
 
                 # Axial Forces - Nonlinear Calculation
-                info_text += "\nAxial Forces (Nonlinear Calculation):\n"
-                for element, force in enumerate(self.solution['axial_forces_nonlinear']):
-                    info_text += f"Element {element}: N = {force} kN.\n"
+                info_text.append(axial_force_information('Nonlinear', self.solution['axial_forces_nonlinear']))
 
                 # Strains - Nonlinear Calculation
                 info_text_strain_nonlinear += "\nElement strains (Nonlinear Calculation):\n"
                 for element, strain in enumerate(self.solution['strains_nonlinear']):
-                    eps_f_i = abs(self.input_elements[str(element)]['ele_eps_f'])
-                    beta_i = abs(self.input_elements[str(element)]['ele_quad_coeff'])
-                    if (abs(strain) <= eps_f_i) and (beta_i != 0):
-                        strain_nonlinear_info.append(f"Element {element}: |ε| = {round(abs(strain[0]) * 100, 4)} "
+                    eps_f_i = abs(self.input_elements[element].ele_eps_f)
+                    beta_i = abs(self.input_elements[element].ele_quad_coeff)
+                    # Absolute strain and its rounded percentage, shared by all three cases
+                    strain_abs = abs(strain[0])
+                    strain_percent = round(strain_abs * 100, 4)
+                    if (strain_abs <= eps_f_i) and (beta_i != 0):
+                        strain_nonlinear_info.append(f"Element {element}: |ε| = {strain_percent} "
                                                      f"≤ {eps_f_i * 100} [%].\n")
                         strain_nonlinear_tag.append("green_text")
-                    elif abs(strain) > eps_f_i and (beta_i != 0):
-                        strain_nonlinear_info.append(f"Element {element}: |ε| = {round(abs(strain[0]) * 100, 4)} "
+                    elif strain_abs > eps_f_i and (beta_i != 0):
+                        strain_nonlinear_info.append(f"Element {element}: |ε| = {strain_percent} "
                                                      f"> {eps_f_i * 100} [%].\n")
                         strain_nonlinear_tag.append("red_text")
                     elif beta_i == 0:
-                        strain_nonlinear_info.append(f"Element {element}: |ε| = {round(abs(strain[0]) * 100, 4)} [%]"
+                        strain_nonlinear_info.append(f"Element {element}: |ε| = {strain_percent} [%]"
                                                      f" (linear element).\n")
                         strain_nonlinear_tag.append("green_text")
 
                 # Additional Information (iterations, force imbalance)
-                max_nodal_force_imbalance = max(abs(self.solution['node_forces_mismatch']))
+                max_nodal_force_imbalance = np.abs(self.solution['node_forces_mismatch']).max()
                 delta_f_max = self.input_calc_param['delta_f_max']
                 info_text_calc = "\nConvergence of the solution:\n"
-                # Check nodal force imbalance and apply tag
-                if max_nodal_force_imbalance < delta_f_max:
-                    imbalance_info = (f"SUCCESS: Termination criterion ΔF = {max_nodal_force_imbalance[0]} kN < "
+                # Check nodal force imbalance and apply tag, the iteration may also have stopped by the step size
+                if self.solution.get('step_max') is not None:
+                    imbalance_info = (f"SUCCESS: Termination criterion Δu = {self.solution['step_max']} mm ≤ "
+                                      f"Δu_max = {self.input_calc_param['delta_u_max']} mm "
+                                      f"met at iteration step {self.solution['iteration_break_number']}.")
+                    imbalance_tag = "green_text"
+                elif max_nodal_force_imbalance < delta_f_max:
+                    imbalance_info = (f"SUCCESS: Termination criterion ΔF = {max_nodal_force_imbalance} kN < "
                                       f"ΔF_max = {delta_f_max} kN "
                                       f"met at iteration step {self.solution['iteration_break_number']}.")
                     imbalance_tag = "green_text"
                 else:
-                    imbalance_info = (f"WARNING: Termination criterion ΔF = {max_nodal_force_imbalance[0]} kN < "
+                    imbalance_info = (f"WARNING: Termination criterion ΔF = {max_nodal_force_imbalance} kN < "
                                       f"ΔF_max = {delta_f_max}  kN is not met! The iteration stopped after maximal "
                                       f"amount of {self.solution['iteration_break_number']} iterations.")
                     imbalance_tag = "red_text"
             else:
                 # Node Displacements
-                info_text += "\nNode Displacements (Linear Calculation):\n"
-                for node, displacement in enumerate(self.solution['node_displacements_linear']):
-                    info_text += (f"Node {node}: u = {round(displacement[0] * 1000, 3)} mm, w = "
-                                  f"{round(displacement[1] * 1000, 2)} mm.\n")
+                info_text.append(displacement_information('Linear', self.solution['node_displacements_linear']))
 
                 # Axial Forces - Linear Calculation
-                info_text += "\nAxial Forces (Linear Calculation):\n"
-                for element, force in enumerate(self.solution['axial_forces_linear']):
-                    info_text += f"Element {element}: N = {force} kN.\n"
+                info_text.append(axial_force_information('Linear', self.solution['axial_forces_linear']))
 
         else:
-            info_text += "\nNo calculation results available."
+            info_text.append("\nNo calculation results available.")
 
-        # Updating the text widget
-        self.current_calculation_information.config(state='normal')
-        self.current_calculation_information.delete(1.0, tk.END)
-        self.current_calculation_information.insert(tk.END, info_text)
+        # Collect (text, tags) pairs and update the text widget with a single replace
+        contents = ["".join(info_text), ()]
         if strain_nonlinear_tag:
-            self.current_calculation_information.insert(tk.END, info_text_strain_nonlinear)
-            for key, strain_text in enumerate(strain_nonlinear_info):
-                self.current_calculation_information.insert(tk.END, strain_text, strain_nonlinear_tag[key])
+            contents += [info_text_strain_nonlinear, ()]
+            for strain_text, strain_tag in zip(strain_nonlinear_info, strain_nonlinear_tag):
+                contents += [strain_text, strain_tag]
         if imbalance_tag:
-            self.current_calculation_information.insert(tk.END, info_text_calc)
-            self.current_calculation_information.insert(tk.END, imbalance_info, imbalance_tag)
-
-        self.current_calculation_information.config(state='disabled')
+            contents += [info_text_calc, (), imbalance_info, imbalance_tag]
+        with editable_text(self.current_calculation_information):
+            self.current_calculation_information.replace("1.0", "end-1c", *contents)
 
     def draw_coordinate_system(self):
+        # Drawn once, the items tagged 'axes' are kept when the canvas is cleared for a redraw
         # Define starting point (top-left corner with some padding)
         start_x, start_y = 10, 10
 
@@ -758,32 +1163,34 @@ class TrussAnalysisApp(tk.Tk):
         arrow_length = 40
 
         # Draw x-axis arrow
-        self.canvas.create_line(start_x, start_y, start_x + arrow_length, start_y, arrow=tk.LAST)
+        self.canvas.create_line(start_x, start_y, start_x + arrow_length, start_y, arrow=tk.LAST, tags='axes')
         self.canvas.create_text(start_x + arrow_length - 5, start_y + 8, text="x", anchor="center", width=1.5,
-                                font=GUI_Settings.ITALIC_FONT_1)
+                                font=self.italic_font, tags='axes')
 
         # Draw y-axis arrow
-        self.canvas.create_line(start_x, start_y, start_x, start_y + arrow_length, arrow=tk.LAST)
+        self.canvas.create_line(start_x, start_y, start_x, start_y + arrow_length, arrow=tk.LAST, tags='axes')
         self.canvas.create_text(start_x + 12, start_y + arrow_length - 8, text="y", anchor="center", width=1.5,
-                                font=GUI_Settings.ITALIC_FONT_1)
+                                font=self.italic_font, tags='axes')
 
     def calculate_bounds_and_scale(self):
-        min_x = min([node[0] for element in self.input_elements.values() for node in
-                     [element['ele_node_i'], element['ele_node_j']]], default=0)
-        max_x = max([node[0] for element in self.input_elements.values() for node in
-                     [element['ele_node_i'], element['ele_node_j']]], default=0)
-        min_y = min([node[1] for element in self.input_elements.values() for node in
-                     [element['ele_node_i'], element['ele_node_j']]], default=0)
-        max_y = max([node[1] for element in self.input_elements.values() for node in
-                     [element['ele_node_i'], element['ele_node_j']]], default=0)
+        # The bounds are computed once per change of the elements or the canvas size, not for every drawn point
+        canvas_width, canvas_height = self.canvas_size
+        if self.view_cache is not None and self.view_cache[0] == (canvas_width, canvas_height):
+            return self.view_cache[1]
+
+        # Both nodes of all elements as rows (x, y), reduced column wise in one pass each
+        nodes = np.array([(element.ele_node_i, element.ele_node_j) for element in self.input_elements],
+                         dtype=float).reshape(-1, 2)
+        if len(nodes):
+            min_x, min_y = nodes.min(axis=0).tolist()
+            max_x, max_y = nodes.max(axis=0).tolist()
+        else:
+            min_x = min_y = max_x = max_y = 0
 
         truss_width = max_x - min_x
         truss_height = max_y - min_y
         max_dimension = max(abs(truss_width), abs(truss_height))
 
-        canvas_width = self.canvas.winfo_width()
-        canvas_height = self.canvas.winfo_height()
-
         scale_x = canvas_width / (truss_width if truss_width != 0 else 1)
         scale_y = canvas_height / (truss_height if truss_height != 0 else 1)
 
@@ -792,6 +1199,7 @@ class TrussAnalysisApp(tk.Tk):
         translate_x = (canvas_width - scale * truss_width) / 2 - min_x * scale
         translate_y = (canvas_height - scale * truss_height) / 2 - min_y * scale
 
+        self.view_cache = ((canvas_width, canvas_height), (scale, translate_x, translate_y, max_dimension))
         return scale, translate_x, translate_y, max_dimension
 
     def scale_and_translate(self, x, y):
@@ -799,101 +1207,58 @@ class TrussAnalysisApp(tk.Tk):
         return x * scale + translate_x, y * scale + translate_y
 
     def draw_element(self):
-        # Draw Elements (Truss Members)
-        for element in self.input_elements.values():
-            hinge_radius = 7
-            node_i = self.scale_and_translate(*element['ele_node_i'])
-            node_j = self.scale_and_translate(*element['ele_node_j'])
-            # Draw the line representing the truss element
-            self.canvas.create_line(node_i[0], node_i[1], node_j[0], node_j[1], fill="black", width=2.5)
-            # Draw hinge at node_i
-            self.canvas.create_oval(node_i[0] - hinge_radius, node_i[1] - hinge_radius,
-                                    node_i[0] + hinge_radius, node_i[1] + hinge_radius, outline="black", fill="white",
-                                    width=2.5)
-
-            # Draw hinge at node_j
-            self.canvas.create_oval(node_j[0] - hinge_radius, node_j[1] - hinge_radius,
-                                    node_j[0] + hinge_radius, node_j[1] + hinge_radius, outline="black", fill="white",
-                                    width=2.5)
+        # Draw Elements (Truss Members), already drawn elements are moved instead of being recreated
+        hinge_radius = 7
+        # Canvas coordinates (x_i, y_i, x_j, y_j) of all elements, transformed as one array
+        scale, translate_x, translate_y, max_dimension = self.calculate_bounds_and_scale()
+        element_coords = (np.array([(element.ele_node_i, element.ele_node_j) for element in self.input_elements],
+                                   dtype=float).reshape(-1, 4) * scale
+                          + (translate_x, translate_y, translate_x, translate_y))
+        for key, line_coords in enumerate(element_coords.tolist()):
+            node_i, node_j = line_coords[:2], line_coords[2:]
+            hinge_i_coords = (node_i[0] - hinge_radius, node_i[1] - hinge_radius,
+                              node_i[0] + hinge_radius, node_i[1] + hinge_radius)
+            hinge_j_coords = (node_j[0] - hinge_radius, node_j[1] - hinge_radius,
+                              node_j[0] + hinge_radius, node_j[1] + hinge_radius)
+            if key in self.element_items:
+                # Move the existing line and hinges of the element
+                line, hinge_i, hinge_j = self.element_items[key]
+                self.canvas.coords(line, *line_coords)
+                self.canvas.coords(hinge_i, *hinge_i_coords)
+                self.canvas.coords(hinge_j, *hinge_j_coords)
+            else:
+                # Draw the line representing the truss element
+                line = self.canvas.create_line(*line_coords, fill="black", width=2.5, tags='element')
+                # Draw hinge at node_i
+                hinge_i = self.canvas.create_oval(*hinge_i_coords, outline="black", fill="white", width=2.5,
+                                                  tags='element')
+                # Draw hinge at node_j
+                hinge_j = self.canvas.create_oval(*hinge_j_coords, outline="black", fill="white", width=2.5,
+                                                  tags='element')
+                self.element_items[key] = (line, hinge_i, hinge_j)
+
+        # Remove the canvas items of deleted elements
+        for key in [key for key in self.element_items if key >= len(self.input_elements)]:
+            self.canvas.delete(*self.element_items.pop(key))
+        # Keep the elements on top of the items drawn before
+        self.canvas.tag_raise('element')
 
     def draw_support(self, color, displacement):
         # Draw Supports
-        for support in self.input_supports.values():
+        if displacement is not None:
+            max_displacement = np.max(abs(displacement))
+            deformation_scale = 0.4 / max_displacement
+        for support in self.input_supports:
             if displacement is None:
-                node = self.scale_and_translate(*support['sup_node'])
+                node = self.scale_and_translate(*support.sup_node)
             else:
-                max_displacement = np.max(abs(displacement))
-                deformation_scale = 0.4 / max_displacement
-                node0 = support['sup_node']
-                node_index = int(self.node_to_index[support['sup_node']])
+                node0 = support.sup_node
+                node_index = int(self.node_to_index[support.sup_node])
                 node_displacement = displacement[node_index]
                 node = self.scale_and_translate(*(node0 + node_displacement * deformation_scale))
             hinge_radius = 7
-            x, y = node
-            dxy = 29  # Defines the size of the plotted support
-            s_dx = 20
-            s_dy = 15
-            s_hline_dxy = 10
-            dxy_hline = 36  # Defines the size of the horizontal line of
-            # Support fixed in x- and y- direction:
-            if support['c_x'] == '∞' and support['c_y'] == '∞':
-                points = [(x, y), (x - dxy, y + dxy), (x + dxy, y + dxy), (x, y)]
-                for i in range(len(points) - 1):
-                    start = points[i]
-                    end = points[i + 1]
-                    self.canvas.create_line(start[0], start[1], end[0], end[1], fill=color, width=2.5)
-            # Support fixed only in x-direction:
-            if support['c_x'] == '∞' and support['c_y'] != '∞':
-                points = [(x, y), (x + dxy, y - dxy), (x + dxy, y + dxy), (x, y)]
-                points_hline = [(x + dxy_hline, y - dxy_hline), (x + dxy_hline, y + dxy_hline)]
-                self.canvas.create_line(points_hline[0][0], points_hline[0][1], points_hline[1][0], points_hline[1][1],
-                                        fill=color, width=2.5)
-                for i in range(len(points) - 1):
-                    start = points[i]
-                    end = points[i + 1]
-                    self.canvas.create_line(start[0], start[1], end[0], end[1], fill=color, width=2.5)
-            # Support fixed only in y-direction:
-            if support['c_x'] != '∞' and support['c_y'] == '∞':
-                points = [(x, y), (x - dxy, y + dxy), (x + dxy, y + dxy), (x, y)]
-                points_hline = [(x - dxy_hline, y + dxy_hline), (x + dxy_hline, y + dxy_hline)]
-                self.canvas.create_line(points_hline[0][0], points_hline[0][1], points_hline[1][0], points_hline[1][1],
-                                        fill=color, width=2.5)
-                for i in range(len(points) - 1):
-                    start = points[i]
-                    end = points[i + 1]
-                    self.canvas.create_line(start[0], start[1], end[0], end[1], fill=color, width=2.5)
-            # Support elastic in y-direction and free in x-direction:
-            if support['c_y'] != '∞':
-                if support['c_y'] > 0:
-                    points = [(x, y), (x + s_dx / 2, y + s_dy / 2), (x - s_dx / 2, y + s_dy),
-                              (x + s_dx / 2, y + 1.5 * s_dy),
-                              (x - s_dx / 2, y + 2 * s_dy), (x + s_dx / 2, y + 2.5 * s_dy),
-                              (x - s_dx / 2, y + 2.5 * s_dy)]
-                    points_hline = [(x - s_dx / 2 - s_hline_dxy, y + 2.5 * s_dy + s_hline_dxy / 2),
-                                    (x + s_dx / 2 + s_hline_dxy, y + 2.5 * s_dy + s_hline_dxy / 2)]
-                    self.canvas.create_line(points_hline[0][0], points_hline[0][1], points_hline[1][0],
-                                            points_hline[1][1],
-                                            fill=color, width=2.5)
-                    for i in range(len(points) - 1):
-                        start = points[i]
-                        end = points[i + 1]
-                        self.canvas.create_line(start[0], start[1], end[0], end[1], fill=color, width=2.5)
-            # Support elastic in x-direction and free in y-direction:
-            if support['c_x'] != '∞':
-                if support['c_x'] > 0:
-                    points = [(x, y), (x + s_dy / 2, y + s_dx / 2), (x + s_dy, y - s_dx / 2),
-                              (x + 1.5 * s_dy, y + s_dx / 2),
-                              (x + 2 * s_dy, y - s_dx / 2), (x + 2.5 * s_dy, y + s_dx / 2),
-                              (x + 2.5 * s_dy, y - s_dx / 2)]
-                    points_hline = [(x + 2.5 * s_dy + s_hline_dxy / 2, y - s_dx / 2 - s_hline_dxy),
-                                    (x + 2.5 * s_dy + s_hline_dxy / 2, y + s_dx / 2 + s_hline_dxy)]
-                    self.canvas.create_line(points_hline[0][0], points_hline[0][1], points_hline[1][0],
-                                            points_hline[1][1],
-                                            fill=color, width=2.5)
-                    for i in range(len(points) - 1):
-                        start = points[i]
-                        end = points[i + 1]
-                        self.canvas.create_line(start[0], start[1], end[0], end[1], fill=color, width=2.5)
+            for points in support_outlines(*node, support.c_x, support.c_y):
+                self.canvas.create_line(*points, fill=color, width=2.5, joinstyle="round")
             # Draw hinge at node
             self.canvas.create_oval(node[0] - hinge_radius, node[1] - hinge_radius,
                                     node[0] + hinge_radius, node[1] + hinge_radius, outline=color, fill="white",
@@ -905,13 +1270,13 @@ class TrussAnalysisApp(tk.Tk):
         arrow_shape = (10, 12, 5)  # Length, Length, Width of the arrow. Adjust as needed.
         self.max_force = 1
         # Determine max force for scaling
-        for load in self.input_forces.values():
-            f_x, f_y = load['f_x'], load['f_y']
+        for load in self.input_forces:
+            f_x, f_y = load.f_x, load.f_y
             self.max_force = max(self.max_force, abs(f_x), abs(f_y))
         # Draw loads
-        for load in self.input_forces.values():
-            node = self.scale_and_translate(*load['force_node'])
-            f_x, f_y = load['f_x'], load['f_y']
+        for load in self.input_forces:
+            node = self.scale_and_translate(*load.force_node)
+            f_x, f_y = load.f_x, load.f_y
             scale_fx = np.max((abs(f_x / self.max_force) * 80, 20))
             scale_fy = np.max((abs(f_y / self.max_force) * 80, 20))
 
@@ -926,7 +1291,7 @@ class TrussAnalysisApp(tk.Tk):
                 label_offset_x = 18
                 label_offset_y = -14.6
                 self.canvas.create_text(node[0] + scale_fx + label_offset_x + dxy, node[1] + label_offset_y,
-                                        text=f_x_label, fill="blue", font=GUI_Settings.STANDARD_FONT_1,
+                                        text=f_x_label, fill="blue", font=self.standard_font,
                                         tags='load_label')
             if f_y != 0:
                 if f_y > 0:
@@ -939,7 +1304,7 @@ class TrussAnalysisApp(tk.Tk):
                 label_offset_x = 7.3
                 label_offset_y = -13.1
                 self.canvas.create_text(node[0] + label_offset_x, node[1] - scale_fy + label_offset_y - dxy,
-                                        text=f_y_label, fill="blue", font=GUI_Settings.STANDARD_FONT_1,
+                                        text=f_y_label, fill="blue", font=self.standard_font,
                                         tags='load_label')
 
     def clear_load(self):
@@ -962,12 +1327,13 @@ class TrussAnalysisApp(tk.Tk):
             # Draw Loads
             dxy = 40
             arrow_shape = (10, 12, 5)  # Length, Length, Width of the arrow. Adjust as needed
+            min_reaction_force = 1  # Reaction forces up to 1 kN are not drawn
             for index, reaction in enumerate(reactions):
                 node = self.scale_and_translate(*self.nodes[index])
                 f_x, f_y = reaction[0], reaction[1]
                 scale_fx = np.max((abs(f_x / self.max_reaction_force) * 80, 20))
                 scale_fy = np.max((abs(f_y / self.max_reaction_force) * 80, 20))
-                if abs(f_x) > np.max((1, self.input_calc_param_init['delta_f_max'])):
+                if abs(f_x) > min_reaction_force:
                     if f_x > 0:
                         self.canvas.create_line(node[0] - dxy, node[1], node[0] - scale_fx - dxy, node[1],
                                                 arrow=tk.LAST,
@@ -980,9 +1346,9 @@ class TrussAnalysisApp(tk.Tk):
                     label_offset_x = 60
                     label_offset_y = -18.6
                     self.canvas.create_text(node[0] - scale_fx - label_offset_x, node[1] + label_offset_y,
-                                            text=f_x_label, fill="purple", font=GUI_Settings.STANDARD_FONT_1,
+                                            text=f_x_label, fill="purple", font=self.standard_font,
                                             tags='reaction_label')
-                if abs(f_y) > np.max((1, self.input_calc_param_init['delta_f_max'])):
+                if abs(f_y) > min_reaction_force:
                     if f_y > 0:
                         self.canvas.create_line(node[0], node[1] + scale_fy + dxy, node[0], node[1] + dxy,
                                                 arrow=tk.LAST,
@@ -995,25 +1361,25 @@ class TrussAnalysisApp(tk.Tk):
                     label_offset_x = 70
                     label_offset_y = 25
                     self.canvas.create_text(node[0] + label_offset_x, node[1] + scale_fy + label_offset_y,
-                                            text=f_y_label, fill="purple", font=GUI_Settings.STANDARD_FONT_1,
+                                            text=f_y_label, fill="purple", font=self.standard_font,
                                             tags='reaction_label')
 
     def toggle_header(self):
         if self.show_header_state.get():
-            self.canvas.create_text(self.canvas.winfo_width() - 10, 10, text=self.header_text, anchor='ne',
+            self.canvas.create_text(self.canvas_size[0] - 10, 10, text=self.header_text, anchor='ne',
                                     fill="black",
-                                    font=GUI_Settings.STANDARD_FONT_1, tags='header')
+                                    font=self.standard_font, tags='header')
         else:
             self.canvas.delete("header")
 
     def label_nodes(self):
         self.nodes = []
-        for element in self.input_elements.values():
+        for element in self.input_elements:
             # Check and add nodes to the list if they are not already in it
-            if element['ele_node_i'] not in self.nodes:
-                self.nodes.append(element['ele_node_i'])
-            if element['ele_node_j'] not in self.nodes:
-                self.nodes.append(element['ele_node_j'])
+            if element.ele_node_i not in self.nodes:
+                self.nodes.append(element.ele_node_i)
+            if element.ele_node_j not in self.nodes:
+                self.nodes.append(element.ele_node_j)
 
         # Create node label
         label_offset_x = 10
@@ -1021,7 +1387,7 @@ class TrussAnalysisApp(tk.Tk):
         for index, node in enumerate(self.nodes):
             node = self.scale_and_translate(*node)
             self.canvas.create_text(node[0] + label_offset_x, node[1] + label_offset_y,
-                                    text=f"N{index}", fill="dark orange", font=GUI_Settings.STANDARD_FONT_1,
+                                    text=f"N{index}", fill="dark orange", font=self.standard_font,
                                     tags='node_label')
 
     def toggle_node_labels(self):
@@ -1034,15 +1400,15 @@ class TrussAnalysisApp(tk.Tk):
         label_offset_x = 17
         label_offset_y = -17
         index = 0
-        for element in self.input_elements.values():
-            node_i = element['ele_node_i']
-            node_j = element['ele_node_j']
+        for element in self.input_elements:
+            node_i = element.ele_node_i
+            node_j = element.ele_node_j
             label_x = node_i[0] + (node_j[0] - node_i[0]) / 2
             label_y = node_i[1] + (node_j[1] - node_i[1]) / 2
             label_sign = np.sign((node_j[0] - node_i[0]) * (node_j[1] - node_i[1]))
             label_x, label_y = self.scale_and_translate(label_x, label_y)
             self.canvas.create_text(label_x + label_offset_x * label_sign, label_y + label_offset_y,
-                                    text=f"E{index}", fill="dark orange", font=GUI_Settings.STANDARD_FONT_1,
+                                    text=f"E{index}", fill="dark orange", font=self.standard_font,
                                     tags='element_label')
             index += 1
 
@@ -1053,12 +1419,13 @@ class TrussAnalysisApp(tk.Tk):
             self.canvas.delete("element_label")
 
     def plot_deformation_system(self, displacement):
-        # Clear existing canvas
-        self.canvas.delete("all")
+        # Clear existing canvas, the elements and deformed elements are kept and moved
+        self.canvas.delete("!(element||deformation||axes)")
+        if not self.canvas.find_withtag('deformation'):
+            # The deformed elements were removed by another plot
+            self.deformation_items = {}
         # Create grid, if selected
         self.toggle_grid()
-        # Draw coordinate system
-        self.draw_coordinate_system()
         # Draw undeformed elements, supports, and loads
         self.draw_element()
         self.draw_support('black', None)
@@ -1082,9 +1449,9 @@ class TrussAnalysisApp(tk.Tk):
         self.toggle_header()
 
         # Draw deformed elements
-        for element_id, element in self.input_elements.items():
-            node_i_index = int(self.node_to_index[element['ele_node_i']])
-            node_j_index = int(self.node_to_index[element['ele_node_j']])
+        for element_id, element in enumerate(self.input_elements):
+            node_i_index = int(self.node_to_index[element.ele_node_i])
+            node_j_index = int(self.node_to_index[element.ele_node_j])
 
             # Get the displacements for the nodes
             u_i, v_i = displacement[node_i_index]
@@ -1095,29 +1462,44 @@ class TrussAnalysisApp(tk.Tk):
             u_j_scaled, v_j_scaled = u_j * deformation_scale, v_j * deformation_scale
 
             # Calculate the deformed positions of the nodes
-            node_i_deformed = self.scale_and_translate(element['ele_node_i'][0] + u_i_scaled,
-                                                       element['ele_node_i'][1] + v_i_scaled)
-            node_j_deformed = self.scale_and_translate(element['ele_node_j'][0] + u_j_scaled,
-                                                       element['ele_node_j'][1] + v_j_scaled)
-
-            # Draw the deformed element
-            self.canvas.create_line(node_i_deformed[0], node_i_deformed[1], node_j_deformed[0], node_j_deformed[1],
-                                    fill="red", width=2.5)  # Use a different color to distinguish
-            # Draw hinge at node_i
-            self.canvas.create_oval(node_i_deformed[0] - hinge_radius, node_i_deformed[1] - hinge_radius,
-                                    node_i_deformed[0] + hinge_radius, node_i_deformed[1] + hinge_radius, outline="red",
-                                    fill="white", width=2.5)
-
-            # Draw hinge at node_j
-            self.canvas.create_oval(node_j_deformed[0] - hinge_radius, node_j_deformed[1] - hinge_radius,
-                                    node_j_deformed[0] + hinge_radius, node_j_deformed[1] + hinge_radius, outline="red",
-                                    fill="white", width=2.5)
-            # Draw supports
-            self.draw_support('red', displacement)
+            node_i_deformed = self.scale_and_translate(element.ele_node_i[0] + u_i_scaled,
+                                                       element.ele_node_i[1] + v_i_scaled)
+            node_j_deformed = self.scale_and_translate(element.ele_node_j[0] + u_j_scaled,
+                                                       element.ele_node_j[1] + v_j_scaled)
+
+            line_coords = (node_i_deformed[0], node_i_deformed[1], node_j_deformed[0], node_j_deformed[1])
+            hinge_i_coords = (node_i_deformed[0] - hinge_radius, node_i_deformed[1] - hinge_radius,
+                              node_i_deformed[0] + hinge_radius, node_i_deformed[1] + hinge_radius)
+            hinge_j_coords = (node_j_deformed[0] - hinge_radius, node_j_deformed[1] - hinge_radius,
+                              node_j_deformed[0] + hinge_radius, node_j_deformed[1] + hinge_radius)
+            if element_id in self.deformation_items:
+                # Move the existing deformed line and hinges
+                line, hinge_i, hinge_j = self.deformation_items[element_id]
+                self.canvas.coords(line, *line_coords)
+                self.canvas.coords(hinge_i, *hinge_i_coords)
+                self.canvas.coords(hinge_j, *hinge_j_coords)
+            else:
+                # Draw the deformed element
+                line = self.canvas.create_line(*line_coords, fill="red", width=2.5,  # Use a different color
+                                               tags='deformation')
+                # Draw hinge at node_i
+                hinge_i = self.canvas.create_oval(*hinge_i_coords, outline="red", fill="white", width=2.5,
+                                                  tags='deformation')
+                # Draw hinge at node_j
+                hinge_j = self.canvas.create_oval(*hinge_j_coords, outline="red", fill="white", width=2.5,
+                                                  tags='deformation')
+                self.deformation_items[element_id] = (line, hinge_i, hinge_j)
+
+        # Remove the deformed items of deleted elements and keep the deformation above the undeformed system
+        for key in [key for key in self.deformation_items if key >= len(self.input_elements)]:
+            self.canvas.delete(*self.deformation_items.pop(key))
+        self.canvas.tag_raise('deformation')
+        # Draw supports once for all elements
+        self.draw_support('red', displacement)
 
     def plot_axial_forces(self, calculation_type):
-        # Clear existing canvas
-        self.canvas.delete("all")
+        # Clear existing canvas, the elements are kept and moved by draw_element
+        self.canvas.delete("!(element||axes)")
         # Create grid, if selected
         self.toggle_grid()
 
@@ -1144,7 +1526,7 @@ class TrussAnalysisApp(tk.Tk):
         self.toggle_header()
 
         # Scaling and normalization
-        max_abs_force = max(abs(np.array(axial_forces)))
+        max_abs_force = np.abs(axial_forces).max()
         scale, translate_x, translate_y, max_dimension = self.calculate_bounds_and_scale()
         force_scale = 0.6
         axial_forces_norm = axial_forces / max_abs_force
@@ -1154,9 +1536,9 @@ class TrussAnalysisApp(tk.Tk):
             if force == 0:
                 continue  # Skip zero forces
             # Get element coordinates and initialize plot coordinates
-            element = self.input_elements[str(element_id)]
-            node_i = self.scale_and_translate(*element['ele_node_i'])
-            node_j = self.scale_and_translate(*element['ele_node_j'])
+            element = self.input_elements[element_id]
+            node_i = self.scale_and_translate(*element.ele_node_i)
+            node_j = self.scale_and_translate(*element.ele_node_j)
             force_plot_coordinates = np.zeros((4, 2), np.float64)
             force_plot_coordinates[0][:] = node_i
             force_plot_coordinates[3][:] = node_j
@@ -1199,71 +1581,105 @@ class TrussAnalysisApp(tk.Tk):
                                     fill=color, width=2.5)
             # Add a label showing the magnitude of the force
             self.canvas.create_text(float(label_x), float(label_y), text=f"{force:.2f} kN", fill=color,
-                                    font=GUI_Settings.RESULTS_FONT_1)
+                                    font=self.results_font)
 
         # Draw undeformed elements, supports, and loads
         self.draw_element()
         self.draw_support('black', None)
-        # Draw coordinate system
-        self.draw_coordinate_system()
         self.toggle_loads()
         self.draw_reaction_forces(reactions)
         self.toggle_node_labels()
         self.toggle_element_labels()
 
-    def add_elements_form(self, parent_frame):
-        # Create Frame
-        frame = ttk.LabelFrame(parent_frame, text="Define elements")
+    def create_form(self, parent_frame, title, rows, buttons):
+        """
+        Creates an input frame with one labeled checkbutton, combobox or entry box per row and a row of buttons
+        :return:
+        """
+        frame = ttk.LabelFrame(parent_frame, text=title)
         frame.pack(padx=10, pady=10, fill='x', anchor='nw')
 
         # Configure the column width
         frame.columnconfigure(0, minsize=GUI_Settings.FRAME_WIDTH_COL1)
         frame.columnconfigure(1, minsize=GUI_Settings.FRAME_WIDTH_COL2)
 
-        # Checkbutton to select linear/nonlinear element
-        ttk.Label(frame, text="Nonlinear element:").grid(row=0, column=0, sticky='w')
-        self.element_type_state = tk.BooleanVar(value=False)
-        self.element_type = ttk.Checkbutton(frame, variable=self.element_type_state,
-                                            command=self.toggle_element_type)
-        self.element_type.grid(row=0, column=1, sticky='w', padx=5)
-
-        # Create Entry boxes and labels for element input parameters
-        ttk.Label(frame, text="Node i (x, y) [m]:").grid(row=1, column=0, sticky='w')
-        self.node_i_entry = ttk.Entry(frame)
-        self.node_i_entry.grid(row=1, column=1, sticky='ew', padx=5, pady=1)
-
-        ttk.Label(frame, text="Node j (x, y) [m]:").grid(row=2, column=0, sticky='w')
-        self.node_j_entry = ttk.Entry(frame)
-        self.node_j_entry.grid(row=2, column=1, sticky='ew', padx=5, pady=0)
-
-        ttk.Label(frame, text="Cross-section area A [cm²]:").grid(row=3, column=0, sticky='w')
-        self.area_entry = ttk.Entry(frame)
-        self.area_entry.grid(row=3, column=1, sticky='ew', padx=5, pady=1)
-
-        ttk.Label(frame, text="Young's modulus E [MPa]:").grid(row=4, column=0, sticky='w')
-        self.emod_entry = ttk.Entry(frame)
-        self.emod_entry.grid(row=4, column=1, sticky='ew', padx=5, pady=0)
-
-        ttk.Label(frame, text="Linear coefficient α [-]:").grid(row=5, column=0, sticky='w')
-        self.lin_coeff_entry = ttk.Entry(frame)
-        self.lin_coeff_entry.grid(row=5, column=1, sticky='ew', padx=5, pady=1)
-
-        ttk.Label(frame, text="Quadratic coefficient β [-]:").grid(row=6, column=0, sticky='w')
-        self.quad_coeff_entry = ttk.Entry(frame)
-        self.quad_coeff_entry.grid(row=6, column=1, sticky='ew', padx=5, pady=0)
-
-        ttk.Label(frame, text="Limit strain ε_y [-]:").grid(row=7, column=0, sticky='w')
-        self.strain_entry = ttk.Entry(frame)
-        self.strain_entry.grid(row=7, column=1, sticky='ew', padx=5, pady=1)
-
-        # Create Button to edit an element
-        self.edit_element_button = ttk.Button(frame, text="Edit/Delete Element", command=self.edit_element,
-                                              state='disabled')
-        self.edit_element_button.grid(row=8, column=0, pady=7, padx=17, sticky='ew')
-        # Create Button to add the element
-        ttk.Button(frame, text="Add Element", command=self.add_element).grid(row=8, column=1, pady=7, padx=10,
-                                                                             sticky='ew')
+        for row, (kind, text, name, *options) in enumerate(rows):
+            if kind == 'entry':
+                self.create_entry_rows(frame, [(text, name)], first_row=row)
+                continue
+            ttk.Label(frame, text=text).grid(row=row, column=0, sticky='w')
+            if kind == 'check':
+                default, command = options
+                state = tk.BooleanVar(value=default)
+                setattr(self, f'{name}_state', state)
+                widget = ttk.Checkbutton(frame, variable=state, command=getattr(self, command))
+                widget.grid(row=row, column=1, sticky='w', padx=5)
+            else:
+                widget = ttk.Combobox(frame, values=options[0] if options else (), state="readonly")
+                widget.grid(row=row, column=1, sticky='ew', padx=5, pady=1)
+            setattr(self, name, widget)
+
+        # A single button spans both columns, otherwise the edit button is left of the add button
+        for column, (text, command, name, state) in enumerate(buttons):
+            button = ttk.Button(frame, text=text, command=getattr(self, command), state=state)
+            if len(buttons) == 1:
+                button.grid(row=len(rows), columnspan=2, pady=7)
+            else:
+                button.grid(row=len(rows), column=column, pady=7, padx=(17, 10)[column], sticky='ew')
+            if name:
+                setattr(self, name, button)
+
+    def create_entry_rows(self, frame, entry_specs, first_row, variables=False):
+        """
+        Creates a label and an entry box per grid row from a list of (label text, attribute name) tuples
+        With variables, the text of each entry box is bound to a StringVar stored as <name without _entry>_var
+        :return:
+        """
+        label, entry = ttk.Label, ttk.Entry
+        for row, (text, name) in enumerate(entry_specs, start=first_row):
+            label(frame, text=text).grid(row=row, column=0, sticky='w')
+            if variables:
+                variable = tk.StringVar(frame)
+                setattr(self, name.replace('_entry', '_var'), variable)
+                entry_box = entry(frame, textvariable=variable)
+            else:
+                entry_box = entry(frame)
+            entry_box.grid(row=row, column=1, sticky='ew', padx=5, pady=row % 2)
+            entry_box.bind('<KeyRelease>', lambda event, entry_name=name: self.schedule_validation(entry_name))
+            setattr(self, name, entry_box)
+
+    def schedule_validation(self, name):
+        # Restart the timer on every keystroke, the entry box is only validated once typing pauses
+        job = self.validate_jobs.get(name)
+        if job:
+            self.after_cancel(job)
+        self.validate_jobs[name] = self.after(150, self.validate_entry, name)
+
+    def validate_entry(self, name):
+        # Mark the content of the entry box red if it cannot be parsed
+        self.validate_jobs.pop(name, None)
+        entry_box = getattr(self, name)
+        if not entry_box.winfo_exists():
+            return
+        text = entry_box.get()
+        if not text or (text == '∞' and 'stiffness' in name):
+            valid = True
+        elif name.endswith(('node_i_entry', 'node_j_entry')):
+            try:
+                parse_coordinates(text)
+                valid = True
+            except CoordinateError:
+                valid = False
+        else:
+            try:
+                float(text)
+                valid = True
+            except ValueError:
+                valid = False
+        entry_box.configure(style='TEntry' if valid else 'Invalid.TEntry')
 
+    def add_elements_form(self, parent_frame):
+        self.create_form(parent_frame, *FORM_SPECS['elements'])
         # Toggle element type
         self.toggle_element_type()
 
@@ -1290,51 +1706,10 @@ class TrussAnalysisApp(tk.Tk):
             self.strain_entry.configure(state='readonly')
 
     def add_supports_form(self, parent_frame):
-        # Create Frame
-        frame = ttk.LabelFrame(parent_frame, text="Define Supports")
-        frame.pack(padx=10, pady=10, fill='x', anchor='nw')
-
-        # Configure the column width
-        frame.columnconfigure(0, minsize=GUI_Settings.FRAME_WIDTH_COL1)
-        frame.columnconfigure(1, minsize=GUI_Settings.FRAME_WIDTH_COL2)
-
-        # Create Entry boxes and labels for element input parameters
-        ttk.Label(frame, text="Support Node (x, y) [m]:").grid(row=0, column=0, sticky='w')
-        # self.support_node_entry = ttk.Entry(frame)
-        self.support_node_entry = ttk.Combobox(frame, state="readonly")
-        self.support_node_entry.grid(row=0, column=1, sticky='ew', padx=5, pady=1)
-
-        ttk.Label(frame, text="Rigid in x-direction:").grid(row=1, column=0, sticky='w')
-        self.support_rigid_cx_state = tk.BooleanVar(value=True)
-        self.support_rigid_cx = ttk.Checkbutton(frame, variable=self.support_rigid_cx_state,
-                                                command=self.toggle_stiffness_cx)
-        self.support_rigid_cx.grid(row=1, column=1, sticky='w', padx=5)
-
-        ttk.Label(frame, text="Rigid in y-direction:").grid(row=2, column=0, sticky='w')
-        self.support_rigid_cy_state = tk.BooleanVar(value=True)
-        self.support_rigid_cy = ttk.Checkbutton(frame, variable=self.support_rigid_cy_state,
-                                                command=self.toggle_stiffness_cy)
-        self.support_rigid_cy.grid(row=2, column=1, sticky='w', padx=5)
-
-        ttk.Label(frame, text="Stiffness c_x [kN/m]:").grid(row=3, column=0, sticky='w')
-        self.stiffness_cx_entry = ttk.Entry(frame)
-        self.stiffness_cx_entry.grid(row=3, column=1, sticky='ew', padx=5, pady=0)
+        self.create_form(parent_frame, *FORM_SPECS['supports'])
         self.toggle_stiffness_cx()
-
-        ttk.Label(frame, text="Stiffness c_y [kN/m]:").grid(row=4, column=0, sticky='w')
-        self.stiffness_cy_entry = ttk.Entry(frame)
-        self.stiffness_cy_entry.grid(row=4, column=1, sticky='ew', padx=5, pady=1)
         self.toggle_stiffness_cy()
 
-        # Create Button to edit a support
-        self.edit_support_button = ttk.Button(frame, text="Edit/Delete Support", command=self.edit_support,
-                                              state='disabled')
-        self.edit_support_button.grid(row=5, column=0, pady=7, padx=17, sticky='ew')
-
-        # Create Button to add the support
-        self.add_support_button = ttk.Button(frame, text="Add Support", command=self.add_support, state='disabled')
-        self.add_support_button.grid(row=5, column=1, pady=7, padx=10, sticky='ew')
-
     def toggle_stiffness_cx(self):
         if self.support_rigid_cx_state.get():
             self.stiffness_cx_entry.delete(0, tk.END)
@@ -1356,84 +1731,31 @@ class TrussAnalysisApp(tk.Tk):
             self.stiffness_cy_entry.insert(0, '0')
 
     def add_loads_form(self, parent_frame):
-        # Create Frame
-        frame = ttk.LabelFrame(parent_frame, text="Define Loads")
-        frame.pack(padx=10, pady=10, fill='x', anchor='nw')
-
-        # Configure the column width
-        frame.columnconfigure(0, minsize=GUI_Settings.FRAME_WIDTH_COL1)
-        frame.columnconfigure(1, minsize=GUI_Settings.FRAME_WIDTH_COL2)
-
-        # Create Entry boxes and labels for element input parameters
-        ttk.Label(frame, text="Force Node (x, y) [m]:").grid(row=0, column=0, sticky='w')
-        # self.force_node_entry = ttk.Entry(frame)
-        self.force_node_entry = ttk.Combobox(frame, state="readonly")
-        self.force_node_entry.grid(row=0, column=1, sticky='ew', padx=5, pady=1)
-
-        ttk.Label(frame, text="Force F_x [kN]:").grid(row=1, column=0, sticky='w')
-        self.force_x_entry = ttk.Entry(frame)
-        self.force_x_entry.grid(row=1, column=1, sticky='ew', padx=5, pady=0)
-        # self.force_x_entry.place(relx=0.9, rely=0.5)
-
-        ttk.Label(frame, text="Force F_y [kN]:").grid(row=2, column=0, sticky='w')
-        self.force_y_entry = ttk.Entry(frame)
-        self.force_y_entry.grid(row=2, column=1, sticky='ew', padx=5, pady=1)
-
-        # Create Button to edit a load
-        self.edit_load_button = ttk.Button(frame, text="Edit/Delete Load", command=self.edit_load, state='disabled')
-        self.edit_load_button.grid(row=3, column=0, pady=7, padx=17, sticky='ew')
-        # Create Button to add the load
-        self.add_load_button = ttk.Button(frame, text="Add Load", command=self.add_load, state='disabled')
-        self.add_load_button.grid(row=3, column=1, pady=7, padx=10, sticky='ew')
+        self.create_form(parent_frame, *FORM_SPECS['loads'])
 
     def calculation_settings_form(self, parent_frame):
-        # Create Frame
-        frame = ttk.LabelFrame(parent_frame, text="Calculation Settings")
-        frame.pack(padx=10, pady=10, fill='x', anchor='nw')
-
-        # Configure the column width
-        frame.columnconfigure(0, minsize=GUI_Settings.FRAME_WIDTH_COL1)
-        frame.columnconfigure(1, minsize=GUI_Settings.FRAME_WIDTH_COL2)
-
-        # Dropdown menu options
-        methods = ["Linear", "Newton-Raphson", "Mod. Newton-Raphson"]
-
-        # Label for dropdown menu
-        ttk.Label(frame, text="Select method:").grid(row=0, column=0, sticky='w')
-
-        # Dropdown menu
-        self.method_combobox = ttk.Combobox(frame, values=methods, state="readonly")
-        self.method_combobox.grid(row=0, column=1, sticky='ew', padx=5, pady=1)
+        self.create_form(parent_frame, *FORM_SPECS['calc'])
         self.method_combobox.current(0)  # Set default selection
 
-        # Create Entry boxes and labels for element calculation parameters
-        ttk.Label(frame, text="Max. number of iterations [-]:").grid(row=1, column=0, sticky='w')
-        self.num_iterations_entry = ttk.Entry(frame)
-        self.num_iterations_entry.grid(row=1, column=1, sticky='ew', padx=5, pady=0)
-
-        ttk.Label(frame, text="Max. deviation ΔF_max [kN]:").grid(row=2, column=0, sticky='w')
-        self.delta_f_entry = ttk.Entry(frame)
-        self.delta_f_entry.grid(row=2, column=1, sticky='ew', padx=5, pady=1)
-
-        ttk.Button(frame, text="Save Settings", command=self.calc_settings).grid(row=3, columnspan=2, pady=7)
-
     def update_node_comboboxes(self):
         self.node_label_to_value_map = {}
         self.node_value_to_index_map = {}
         self.nodes = []
-        for element in self.input_elements.values():
+        for element in self.input_elements:
             # Check and add nodes to the list if they are not already in it
-            if element['ele_node_i'] not in self.nodes:
-                self.nodes.append(element['ele_node_i'])
-            if element['ele_node_j'] not in self.nodes:
-                self.nodes.append(element['ele_node_j'])
+            if element.ele_node_i not in self.nodes:
+                self.nodes.append(element.ele_node_i)
+            if element.ele_node_j not in self.nodes:
+                self.nodes.append(element.ele_node_j)
         for idx, node in enumerate(self.nodes):
             label = f"N{idx}: ({node[0]}, {node[1]})"
             self.node_label_to_value_map[label] = node
             self.node_value_to_index_map[f'{node}'] = idx
 
-        self.support_node_entry['values'] = list(self.node_label_to_value_map.keys())
-        self.force_node_entry['values'] = list(self.node_label_to_value_map.keys())
+        # One tuple of the node labels is shared by both comboboxes
+        node_labels = tuple(self.node_label_to_value_map)
+        self.support_node_entry['values'] = node_labels
+        self.force_node_entry['values'] = node_labels
 
         if self.node_label_to_value_map:
             self.support_node_entry.current(0)
@@ -1443,130 +1765,131 @@ class TrussAnalysisApp(tk.Tk):
         label = combobox.get()
         return self.node_label_to_value_map.get(label, None)  # Returns None if label not found
 
+    def update_lookup_tables(self):
+        # Rebuild the node -> key lookups of the duplicate checks, the first key wins like in a linear search
+        self.element_keys_by_nodes = {}
+        self.support_keys_by_node = {}
+        self.force_keys_by_node = {}
+        for key, element in enumerate(self.input_elements):
+            self.element_keys_by_nodes.setdefault(element_nodes_key(element.ele_node_i, element.ele_node_j), key)
+        for key, support in enumerate(self.input_supports):
+            self.support_keys_by_node.setdefault(support.sup_node, key)
+        for key, force in enumerate(self.input_forces):
+            self.force_keys_by_node.setdefault(force.force_node, key)
+
     def add_element(self):
         try:
-            # Parse the coordinates from the entry fields
-            node_i = self.parse_coordinates(self.node_i_entry.get())
-            node_j = self.parse_coordinates(self.node_j_entry.get())
-
-            # Do not proceed further if the coordinates are invalid
-            if node_i is None or node_j is None:
+            # Parse the coordinates from the entry fields, do not proceed further if they are invalid
+            try:
+                node_i = parse_coordinates(self.node_i_entry.get())
+                node_j = parse_coordinates(self.node_j_entry.get())
+            except CoordinateError as e:
+                messagebox.showwarning("Warning", f"{e}")
                 return
 
             # Parse other fields like area, Young's modulus, coefficients, etc.
-            if self.area_entry.get():
-                if float(self.area_entry.get()) < 0:
-                    messagebox.showwarning("Warning", f"Value of the cross-section area A is negative! "
-                                                      f"The value of A is automatically set to positive.")
-                area = np.abs(float(self.area_entry.get()))
-            else:
+            area = entry_float(self.area_entry, "the cross-section area A")
+            if area is None:
                 messagebox.showwarning("Warning", f"Value of the cross-section area A is empty! "
                                                   f"Please insert a value A > 0!")
                 return
-            if self.emod_entry.get():
-                if float(self.emod_entry.get()) < 0:
-                    messagebox.showwarning("Error", f"Value of the Young's modulus E is negative! "
-                                                    f"The value of E is automatically set to positive.")
-                emod = np.abs(float(self.emod_entry.get()))
             else:
+                if area < 0:
+                    messagebox.showwarning("Warning", f"Value of the cross-section area A is negative! "
+                                                      f"The value of A is automatically set to positive.")
+                area = np.abs(area)
+            emod = entry_float(self.emod_entry, "the Young's modulus E")
+            if emod is None:
                 messagebox.showwarning("Error", f"Value of the Young's modulus E is empty! "
                                                 f"Please insert a value E > 0!")
                 return
-            if self.lin_coeff_entry.get():
-                if float(self.lin_coeff_entry.get()) < 0:
-                    messagebox.showwarning("Warning", f"Value of the linear coefficient α is negative! "
-                                                      f"The value of α is automatically set to positive.")
-                lin_coeff = np.abs(float(self.lin_coeff_entry.get()))
             else:
+                if emod < 0:
+                    messagebox.showwarning("Error", f"Value of the Young's modulus E is negative! "
+                                                    f"The value of E is automatically set to positive.")
+                emod = np.abs(emod)
+            lin_coeff = entry_float(self.lin_coeff_entry, "the linear coefficient α")
+            if lin_coeff is None:
                 lin_coeff = 1
                 messagebox.showwarning("Error", f"Value of the linear coefficient α is empty! "
                                                 f"The coefficient is set to the default value α = 1. ")
-            if self.quad_coeff_entry.get():
-                if float(self.quad_coeff_entry.get()) < 0:
-                    messagebox.showwarning("Warning", f"Value of the quadratic coefficient β is negative! "
-                                                      f"The value of β is automatically set to positive. The sign will "
-                                                      f"automatically change in the calculation depending on whether "
-                                                      f"the element is subjected to tensile or compressive stress.")
-                quad_coeff = np.abs(float(self.quad_coeff_entry.get()))
             else:
+                if lin_coeff < 0:
+                    messagebox.showwarning("Warning", f"Value of the linear coefficient α is negative! "
+                                                      f"The value of α is automatically set to positive.")
+                lin_coeff = np.abs(lin_coeff)
+            quad_coeff = entry_float(self.quad_coeff_entry, "the quadratic coefficient β")
+            if quad_coeff is None:
                 quad_coeff = 0
                 messagebox.showwarning("Error", f"Value of the quadratic coefficient β is empty! "
                                                 f"The coefficient is set to the default value β = 0 "
                                                 f"(linear calculation). ")
-            if self.strain_entry.get():
-                if float(self.strain_entry.get()) < 0:
-                    messagebox.showwarning("Warning", f"Value of the limit strain ε is negative! "
-                                                      f"The value of ε is automatically set to positive. The sign will "
+            else:
+                if quad_coeff < 0:
+                    messagebox.showwarning("Warning", f"Value of the quadratic coefficient β is negative! "
+                                                      f"The value of β is automatically set to positive. The sign will "
                                                       f"automatically change in the calculation depending on whether "
                                                       f"the element is subjected to tensile or compressive stress.")
-                strain_entry = np.abs(float(self.strain_entry.get()))
-            else:
+                quad_coeff = np.abs(quad_coeff)
+            strain_entry = entry_float(self.strain_entry, "the limit strain ε")
+            if strain_entry is None:
                 strain_entry = 0
                 messagebox.showwarning("Error", f"Value of the limit strain ε is empty! "
                                                 f"The limit strain is set to the default value ε = 0 "
                                                 f"(linear calculation). ")
+            else:
+                if strain_entry < 0:
+                    messagebox.showwarning("Warning", f"Value of the limit strain ε is negative! "
+                                                      f"The value of ε is automatically set to positive. The sign will "
+                                                      f"automatically change in the calculation depending on whether "
+                                                      f"the element is subjected to tensile or compressive stress.")
+                strain_entry = np.abs(strain_entry)
 
             # Check for duplicate element
-            if self.add_element_initialise == 1:
-                for key, element in self.input_elements.items():
-                    if element['ele_node_i'] == node_i and element['ele_node_j'] == node_j:
-                        messagebox.showerror("Duplicate Element", "An element with these nodes already exists!"
-                                                                  f"Consider editing element {key} instead!")
-                        return
-
-            # Add the new element to the input_elements dictionary
-            self.input_elements[str(self.ele_number)] = {'ele_number': self.ele_number,
-                                                         'ele_node_i': node_i,
-                                                         'ele_node_j': node_j,
-                                                         'ele_A': area,
-                                                         'ele_E': emod,
-                                                         'ele_lin_coeff': lin_coeff,
-                                                         'ele_quad_coeff': quad_coeff,
-                                                         'ele_eps_f': strain_entry}
-            # Increase unique element number
-            self.ele_number += 1
+            key = self.element_keys_by_nodes.get(element_nodes_key(node_i, node_j))
+            if key is not None:
+                messagebox.showerror("Duplicate Element", "An element with these nodes already exists!"
+                                                          f"Consider editing element {key} instead!")
+                return
+
+            # Add the new element to the input_elements list
+            self.input_elements.append(ElementRecord(node_i, node_j, area, emod, lin_coeff, quad_coeff, strain_entry))
+            self.element_keys_by_nodes.setdefault(element_nodes_key(node_i, node_j), len(self.input_elements) - 1)
 
             # Clearing the entry boxes after adding the element
-            self.node_i_entry.delete(0, tk.END)
-            self.node_j_entry.delete(0, tk.END)
-            self.area_entry.delete(0, tk.END)
-            self.emod_entry.delete(0, tk.END)
-            self.lin_coeff_entry.delete(0, tk.END)
-            self.quad_coeff_entry.delete(0, tk.END)
-            self.strain_entry.delete(0, tk.END)
+            clear_entries(self.node_i_entry, self.node_j_entry, self.area_entry, self.emod_entry,
+                          self.lin_coeff_entry, self.quad_coeff_entry, self.strain_entry)
             # Set element initializer to 1, required to overwrite initial elements properly
             self.add_element_initialise = 1
-            # Update information window
-            self.update_system_information()
-            # Draw element on canvas
-            self.canvas.delete("all")  # Clear the canvas
+            # Update information window and canvas
+            self.notify_changed('elements')
             self.plot_button.config(state='normal')
-            # Create grid, if selected
             self.edit_element_button.config(state='normal')
             self.add_support_button.config(state='normal')
             self.add_load_button.config(state='normal')
-            self.toggle_grid()
-            self.draw_coordinate_system()
-            self.draw_element()
-            self.draw_support('black', None)
-            self.toggle_loads()
-            self.toggle_node_labels()
-            self.toggle_element_labels()
             self.update_node_comboboxes()
             self.element_type_state.set(False)
             self.toggle_element_type()
             self.toggle_run_calculation_button()
 
+        except NumberError as e:
+            messagebox.showwarning("Warning", f"{e}")
+            return
         except Exception as e:
             # Show a warning message box
             messagebox.showerror("Error", f"An error occurred while adding the element: {e} !")
-            print(f"An error occurred while adding the element: {e}")
+            logger.error("An error occurred while adding the element: %s", e)
             return
 
     def edit_element(self):
+        # Reuse the edit window if it was already built
+        if reuse_window(self.edit_window):
+            self.update_element_dropdown()
+            self.toggle_edit_element_type()
+            return
         self.edit_window = tk.Toplevel(self)
-        set_icon(self.edit_window)
         self.edit_window.title("Edit Element")
+        self.edit_window.protocol("WM_DELETE_WINDOW", self.edit_window.withdraw)
         center_window(self.edit_window, 350, 290)
 
         # Frame for entry boxes and labels
@@ -1589,33 +1912,14 @@ class TrussAnalysisApp(tk.Tk):
         self.edit_element_type.grid(row=1, column=1, sticky='w', padx=5)
 
         # Creating labeled entry boxes
-        ttk.Label(edit_frame, text="Node i (x, y) [m]:").grid(row=2, column=0, sticky='w')
-        self.edit_node_i_entry = ttk.Entry(edit_frame)
-        self.edit_node_i_entry.grid(row=2, column=1, sticky='ew', padx=5)
-
-        ttk.Label(edit_frame, text="Node j (x, y) [m]:").grid(row=3, column=0, sticky='w')
-        self.edit_node_j_entry = ttk.Entry(edit_frame)
-        self.edit_node_j_entry.grid(row=3, column=1, sticky='ew', padx=5, pady=1)
-
-        ttk.Label(edit_frame, text="Cross-section area A [cm²]:").grid(row=4, column=0, sticky='w')
-        self.edit_area_entry = ttk.Entry(edit_frame)
-        self.edit_area_entry.grid(row=4, column=1, sticky='ew', padx=5)
-
-        ttk.Label(edit_frame, text="Young's modulus E [MPa]:").grid(row=5, column=0, sticky='w')
-        self.edit_emod_entry = ttk.Entry(edit_frame)
-        self.edit_emod_entry.grid(row=5, column=1, sticky='ew', padx=5, pady=1)
-
-        ttk.Label(edit_frame, text="Linear coefficient α [-]:").grid(row=6, column=0, sticky='w')
-        self.edit_lin_coeff_entry = ttk.Entry(edit_frame)
-        self.edit_lin_coeff_entry.grid(row=6, column=1, sticky='ew', padx=5)
-
-        ttk.Label(edit_frame, text="Quadratic coefficient β [-]:").grid(row=7, column=0, sticky='w')
-        self.edit_quad_coeff_entry = ttk.Entry(edit_frame)
-        self.edit_quad_coeff_entry.grid(row=7, column=1, sticky='ew', padx=5, pady=1)
-
-        ttk.Label(edit_frame, text="Limit strain ε_y [-]:").grid(row=8, column=0, sticky='w')
-        self.edit_strain_entry = ttk.Entry(edit_frame)
-        self.edit_strain_entry.grid(row=8, column=1, sticky='ew', padx=5)
+        self.create_entry_rows(edit_frame, [("Node i (x, y) [m]:", 'edit_node_i_entry'),
+                                            ("Node j (x, y) [m]:", 'edit_node_j_entry'),
+                                            ("Cross-section area A [cm²]:", 'edit_area_entry'),
+                                            ("Young's modulus E [MPa]:", 'edit_emod_entry'),
+                                            ("Linear coefficient α [-]:", 'edit_lin_coeff_entry'),
+                                            ("Quadratic coefficient β [-]:", 'edit_quad_coeff_entry'),
+                                            ("Limit strain ε_y [-]:", 'edit_strain_entry')], first_row=2,
+                               variables=True)
 
         # Button for saving changes
         ttk.Button(edit_frame, text="Save Changes", command=self.save_element_changes).grid(row=9, column=1, padx=5,
@@ -1623,68 +1927,47 @@ class TrussAnalysisApp(tk.Tk):
         # Button for deleting the selected element
         ttk.Button(edit_frame, text="Delete Element", command=self.delete_element).grid(row=9, column=0, padx=5)
 
-        # Initially populate the entry boxes with the current values of the first element
-        self.populate_element_fields()
-
-        # Call update_element_dropdown to initialize the combobox values
+        # Initialize the combobox values and populate the entry boxes with the values of the first element
         self.update_element_dropdown()
 
         # Toggle element type
         self.toggle_edit_element_type()
 
     def toggle_edit_element_type(self):
+        # The coefficients are written through their variables, which also works while the entries are read-only
         if self.edit_element_type_state.get():
             self.edit_lin_coeff_entry.configure(state='normal')
-            self.edit_lin_coeff_entry.delete(0, tk.END)
-            if self.lin_coeff == 1:
-                self.edit_lin_coeff_entry.insert(0, '1')
-            else:
-                self.edit_lin_coeff_entry.insert(0, self.lin_coeff)
+            self.edit_lin_coeff_var.set('1' if self.lin_coeff == 1 else f"{self.lin_coeff}")
             self.edit_quad_coeff_entry.configure(state='normal')
-            self.edit_quad_coeff_entry.delete(0, tk.END)
-            if self.quad_coeff == 0:
-                self.edit_quad_coeff_entry.insert(0, '300')
-            else:
-                self.edit_quad_coeff_entry.insert(0, self.quad_coeff)
+            self.edit_quad_coeff_var.set('300' if self.quad_coeff == 0 else f"{self.quad_coeff}")
             self.edit_strain_entry.configure(state='normal')
-            self.edit_strain_entry.delete(0, tk.END)
-            if self.eps_f == 0:
-                self.edit_strain_entry.insert(0, '0.0025')
-            else:
-                self.edit_strain_entry.insert(0, self.eps_f)
+            self.edit_strain_var.set('0.0025' if self.eps_f == 0 else f"{self.eps_f}")
         else:
-            self.edit_lin_coeff_entry.delete(0, tk.END)
-            self.edit_lin_coeff_entry.insert(0, '1')
+            self.edit_lin_coeff_var.set('1')
             self.edit_lin_coeff_entry.configure(state='readonly')
-            self.edit_quad_coeff_entry.delete(0, tk.END)
-            self.edit_quad_coeff_entry.insert(0, '0')
+            self.edit_quad_coeff_var.set('0')
             self.edit_quad_coeff_entry.configure(state='readonly')
-            self.edit_strain_entry.delete(0, tk.END)
-            self.edit_strain_entry.insert(0, '0')
+            self.edit_strain_var.set('0')
             self.edit_strain_entry.configure(state='readonly')
 
     def populate_element_fields(self, event=None):
         selected_index = self.element_dropdown.current()
         if selected_index != -1:
-            element_id = list(self.input_elements.keys())[selected_index]
+            element_id = selected_index
             element = self.input_elements[element_id]
-            node_i_x = element['ele_node_i'][0]
-            node_i_y = element['ele_node_i'][1]
-            node_j_x = element['ele_node_j'][0]
-            node_j_y = element['ele_node_j'][1]
-            area = element['ele_A']
-            emod = element['ele_E']
-            self.lin_coeff = element['ele_lin_coeff']
-            self.quad_coeff = element['ele_quad_coeff']
-            self.eps_f = element['ele_eps_f']
+            node_i_x, node_i_y = element.ele_node_i
+            node_j_x, node_j_y = element.ele_node_j
+            area = element.ele_A
+            emod = element.ele_E
+            self.lin_coeff = element.ele_lin_coeff
+            self.quad_coeff = element.ele_quad_coeff
+            self.eps_f = element.ele_eps_f
             if self.quad_coeff == 0:
                 self.edit_element_type_state.set(False)
             else:
                 self.edit_element_type_state.set(True)
-            self.edit_node_i_entry.delete(0, tk.END)
-            self.edit_node_i_entry.insert(0, f"{node_i_x}, {node_i_y}")
-            self.edit_node_j_entry.delete(0, tk.END)
-            self.edit_node_j_entry.insert(0, f"{node_j_x}, {node_j_y}")
+            self.edit_node_i_var.set(f"{node_i_x}, {node_i_y}")
+            self.edit_node_j_var.set(f"{node_j_x}, {node_j_y}")
         else:
             node_i_x = " "
             node_i_y = " "
@@ -1695,159 +1978,127 @@ class TrussAnalysisApp(tk.Tk):
             self.lin_coeff = " "
             self.quad_coeff = " "
             self.eps_f = " "
-            self.edit_node_i_entry.delete(0, tk.END)
-            self.edit_node_i_entry.insert(0, f"{node_i_x} {node_i_y}")
-            self.edit_node_j_entry.delete(0, tk.END)
-            self.edit_node_j_entry.insert(0, f"{node_j_x} {node_j_y}")
-
-        self.edit_area_entry.delete(0, tk.END)
-        self.edit_area_entry.insert(0, f"{area}")
-
-        self.edit_emod_entry.delete(0, tk.END)
-        self.edit_emod_entry.insert(0, f"{emod}")
+            self.edit_node_i_var.set(f"{node_i_x} {node_i_y}")
+            self.edit_node_j_var.set(f"{node_j_x} {node_j_y}")
 
-        self.edit_lin_coeff_entry.delete(0, tk.END)
-        self.edit_lin_coeff_entry.insert(0, f"{self.lin_coeff}")
-
-        self.edit_quad_coeff_entry.delete(0, tk.END)
-        self.edit_quad_coeff_entry.insert(0, f"{self.quad_coeff}")
-
-        self.edit_strain_entry.delete(0, tk.END)
-        self.edit_strain_entry.insert(0, f"{self.eps_f}")
+        # One variable write per entry box, the coefficients are written by toggle_edit_element_type
+        self.edit_area_var.set(f"{area}")
+        self.edit_emod_var.set(f"{emod}")
 
         self.toggle_edit_element_type()
 
     def save_element_changes(self):
         try:
             selected_index = self.element_dropdown.current()
-            element_id = list(self.input_elements.keys())[selected_index]
-            # Parse values from entry boxes
-            node_i = self.parse_coordinates(self.edit_node_i_entry.get())
-            node_j = self.parse_coordinates(self.edit_node_j_entry.get())
+            element_id = selected_index
+            # Parse values from entry boxes, do not proceed further if the coordinates are invalid
+            try:
+                node_i = parse_coordinates(self.edit_node_i_entry.get())
+                node_j = parse_coordinates(self.edit_node_j_entry.get())
+            except CoordinateError as e:
+                messagebox.showwarning("Warning", f"{e}")
+                return
 
             # Parse other fields like area, Young's modulus, coefficients, etc.
-            if self.edit_area_entry.get():
-                if float(self.edit_area_entry.get()) < 0:
-                    messagebox.showwarning("Warning", f"Value of the cross-section area A is negative! "
-                                                      f"The value of A is automatically set to positive.")
-                area = np.abs(float(self.edit_area_entry.get()))
-            else:
+            area = entry_float(self.edit_area_entry, "the cross-section area A")
+            if area is None:
                 messagebox.showwarning("Warning", f"Value of the cross-section area A is empty! "
                                                   f"Please insert a value A > 0!")
                 return
-            if self.edit_emod_entry.get():
-                if float(self.edit_emod_entry.get()) < 0:
-                    messagebox.showwarning("Error", f"Value of the Young's modulus E is negative! "
-                                                    f"The value of E is automatically set to positive.")
-                emod = np.abs(float(self.edit_emod_entry.get()))
             else:
+                if area < 0:
+                    messagebox.showwarning("Warning", f"Value of the cross-section area A is negative! "
+                                                      f"The value of A is automatically set to positive.")
+                area = np.abs(area)
+            emod = entry_float(self.edit_emod_entry, "the Young's modulus E")
+            if emod is None:
                 messagebox.showwarning("Error", f"Value of the Young's modulus E is empty! "
                                                 f"Please insert a value E > 0!")
                 return
-            if self.edit_lin_coeff_entry.get():
-                if float(self.edit_lin_coeff_entry.get()) < 0:
-                    messagebox.showwarning("Warning", f"Value of the linear coefficient α is negative! "
-                                                      f"The value of α is automatically set to positive.")
-                lin_coeff = np.abs(float(self.edit_lin_coeff_entry.get()))
             else:
+                if emod < 0:
+                    messagebox.showwarning("Error", f"Value of the Young's modulus E is negative! "
+                                                    f"The value of E is automatically set to positive.")
+                emod = np.abs(emod)
+            lin_coeff = entry_float(self.edit_lin_coeff_entry, "the linear coefficient α")
+            if lin_coeff is None:
                 lin_coeff = 1
                 messagebox.showwarning("Error", f"Value of the linear coefficient α is empty! "
                                                 f"The coefficient is set to the default value α = 1. ")
-            if self.edit_quad_coeff_entry.get():
-                if float(self.edit_quad_coeff_entry.get()) < 0:
-                    messagebox.showwarning("Warning", f"Value of the quadratic coefficient β is negative! "
-                                                      f"The value of β is automatically set to positive. The sign will "
-                                                      f"automatically change in the calculation depending on whether "
-                                                      f"the element is subjected to tensile or compressive stress.")
-                quad_coeff = np.abs(float(self.edit_quad_coeff_entry.get()))
             else:
+                if lin_coeff < 0:
+                    messagebox.showwarning("Warning", f"Value of the linear coefficient α is negative! "
+                                                      f"The value of α is automatically set to positive.")
+                lin_coeff = np.abs(lin_coeff)
+            quad_coeff = entry_float(self.edit_quad_coeff_entry, "the quadratic coefficient β")
+            if quad_coeff is None:
                 quad_coeff = 0
                 messagebox.showwarning("Error", f"Value of the quadratic coefficient β is empty! "
                                                 f"The coefficient is set to the default value β = 0 "
                                                 f"(linear calculation). ")
-            if self.edit_strain_entry.get():
-                if float(self.edit_strain_entry.get()) < 0:
-                    messagebox.showwarning("Warning", f"Value of the limit strain ε is negative! "
-                                                      f"The value of ε is automatically set to positive. The sign will "
+            else:
+                if quad_coeff < 0:
+                    messagebox.showwarning("Warning", f"Value of the quadratic coefficient β is negative! "
+                                                      f"The value of β is automatically set to positive. The sign will "
                                                       f"automatically change in the calculation depending on whether "
                                                       f"the element is subjected to tensile or compressive stress.")
-                strain_entry = np.abs(float(self.edit_strain_entry.get()))
-            else:
+                quad_coeff = np.abs(quad_coeff)
+            strain_entry = entry_float(self.edit_strain_entry, "the limit strain ε")
+            if strain_entry is None:
                 strain_entry = 0
                 messagebox.showwarning("Error", f"Value of the limit strain ε is empty! "
                                                 f"The limit strain is set to the default value ε = 0 "
                                                 f"(linear calculation). ")
+            else:
+                if strain_entry < 0:
+                    messagebox.showwarning("Warning", f"Value of the limit strain ε is negative! "
+                                                      f"The value of ε is automatically set to positive. The sign will "
+                                                      f"automatically change in the calculation depending on whether "
+                                                      f"the element is subjected to tensile or compressive stress.")
+                strain_entry = np.abs(strain_entry)
 
-            # Update the element in the input_elements dictionary
-            self.input_elements[element_id] = {
-                'ele_number': int(element_id),
-                'ele_node_i': node_i,
-                'ele_node_j': node_j,
-                'ele_A': area,
-                'ele_E': emod,
-                'ele_lin_coeff': lin_coeff,
-                'ele_quad_coeff': quad_coeff,
-                'ele_eps_f': strain_entry}
-            # Draw elements, supports and loads on canvas
-            self.canvas.delete("all")  # Clear the canvas
+            # Update the element in the input_elements list
+            element = ElementRecord(node_i, node_j, area, emod, lin_coeff, quad_coeff, strain_entry)
+            if element == self.input_elements[element_id]:
+                # Nothing changed, only close the window
+                self.edit_window.withdraw()
+                return
+            self.input_elements[element_id] = element
             # Update Nodes
             self.update_node_comboboxes()
-            # Check Supports
-            input_supports = copy.deepcopy(self.input_supports)
-            for key, support in self.input_supports.items():
-                if support['sup_node'] not in self.nodes:
-                    del input_supports[key]
-            self.input_supports = copy.deepcopy(input_supports)
-            # Renumbering the remaining supports
-            new_input_supports = {}
-            for i, key in enumerate(sorted(self.input_supports.keys())):
-                new_input_supports[str(i)] = self.input_supports[key]
-                new_input_supports[str(i)]['sup_number'] = i
-            self.input_supports = new_input_supports
+            # Check Supports and renumber the remaining ones
+            delete_records(self.input_supports, [i for i, support in enumerate(self.input_supports)
+                                                 if support.sup_node not in self.nodes])
             # Disable edit button if no supports are defined
-            if self.input_supports == {}:
+            if not self.input_supports:
                 self.add_support_initialise = 0
                 self.edit_support_button.config(state='disabled')
-            # Check Loads
-            input_forces = copy.deepcopy(self.input_forces)
-            for key, force in self.input_forces.items():
-                if force['force_node'] not in self.nodes:
-                    del input_forces[key]
-            self.input_forces = copy.deepcopy(input_forces)
-            # Renumbering the remaining Loads
-            new_input_forces = {}
-            for i, key in enumerate(sorted(self.input_forces.keys())):
-                new_input_forces[str(i)] = self.input_forces[key]
-                new_input_forces[str(i)]['force_number'] = i
-            self.input_forces = new_input_forces
+            # Check Loads and renumber the remaining ones
+            delete_records(self.input_forces, [i for i, force in enumerate(self.input_forces)
+                                               if force.force_node not in self.nodes])
             # Disable edit button if no loads are defined
-            if self.input_forces == {}:
+            if not self.input_forces:
                 self.add_load_initialise = 0
                 self.edit_load_button.config(state='disabled')
-            # Draw everything
-            self.toggle_grid()
-            self.draw_coordinate_system()
-            self.draw_element()
-            self.draw_support('black', None)
-            self.toggle_loads()
-            self.toggle_node_labels()
-            self.toggle_element_labels()
             # Close window
-            self.edit_window.destroy()
-            # Update information window
-            self.update_system_information()
+            self.edit_window.withdraw()
+            self.update_lookup_tables()
+            # Update information window and canvas
+            self.notify_changed('elements', 'supports', 'loads')
+        except NumberError as e:
+            messagebox.showwarning("Warning", f"{e}")
+            return
         except Exception as e:
             # Show a warning message box
             messagebox.showerror("Error", f"An error occurred while adding the element: {e}")
-            print(f"An error occurred while adding the element: {e}")
+            logger.error("An error occurred while adding the element: %s", e)
             return
 
     def update_element_dropdown(self):
-        element_ids = list(self.input_elements.keys())
-        element_display_values = [f"Element {number}" for number in element_ids]
-
-        self.element_dropdown['values'] = element_display_values
-        if element_ids:
+        # The dropdown index is the position of the record in the list
+        self.element_dropdown['values'] = resize_display_values(self.element_display_values, "Element",
+                                                                len(self.input_elements))
+        if self.input_elements:
             self.element_dropdown.current(0)
         else:
             self.element_dropdown.set('')
@@ -1859,15 +2110,9 @@ class TrussAnalysisApp(tk.Tk):
         if selected_index == -1:  # No selection
             return
 
-        element_id = list(self.input_elements.keys())[selected_index]
-        del self.input_elements[element_id]
-        # Renumbering the remaining elements
-        new_input_elements = {}
-        for i, key in enumerate(sorted(self.input_elements.keys())):
-            new_input_elements[str(i)] = self.input_elements[key]
-            new_input_elements[str(i)]['ele_number'] = i
-        self.input_elements = new_input_elements
-        if self.input_elements == {}:
+        # Delete the element and renumber the following elements
+        delete_records(self.input_elements, [selected_index])
+        if not self.input_elements:
             self.add_element_initialise = 0
             self.edit_element_button.config(state='disabled')
             self.add_load_button.config(state='disabled')
@@ -1875,58 +2120,31 @@ class TrussAnalysisApp(tk.Tk):
         # Check if loads or supports are located at the deleted nodes
         # Update global nodes
         self.nodes = []
-        for element in self.input_elements.values():
+        for element in self.input_elements:
             # Check and add nodes to the list if they are not already in it
-            if element['ele_node_i'] not in self.nodes:
-                self.nodes.append(element['ele_node_i'])
-            if element['ele_node_j'] not in self.nodes:
-                self.nodes.append(element['ele_node_j'])
-        # Check Supports
-        input_supports = copy.deepcopy(self.input_supports)
-        for key, support in self.input_supports.items():
-            if support['sup_node'] not in self.nodes:
-                del input_supports[key]
-        self.input_supports = copy.deepcopy(input_supports)
-        # Renumbering the remaining supports
-        new_input_supports = {}
-        for i, key in enumerate(sorted(self.input_supports.keys())):
-            new_input_supports[str(i)] = self.input_supports[key]
-            new_input_supports[str(i)]['sup_number'] = i
-        self.input_supports = new_input_supports
+            if element.ele_node_i not in self.nodes:
+                self.nodes.append(element.ele_node_i)
+            if element.ele_node_j not in self.nodes:
+                self.nodes.append(element.ele_node_j)
+        # Check Supports and renumber the remaining ones
+        delete_records(self.input_supports, [i for i, support in enumerate(self.input_supports)
+                                             if support.sup_node not in self.nodes])
         # Disable edit button if no supports are defined
-        if self.input_supports == {}:
+        if not self.input_supports:
             self.add_support_initialise = 0
             self.edit_support_button.config(state='disabled')
-        # Check Loads
-        input_forces = copy.deepcopy(self.input_forces)
-        for key, force in self.input_forces.items():
-            if force['force_node'] not in self.nodes:
-                del input_forces[key]
-        self.input_forces = copy.deepcopy(input_forces)
-        # Renumbering the remaining Loads
-        new_input_forces = {}
-        for i, key in enumerate(sorted(self.input_forces.keys())):
-            new_input_forces[str(i)] = self.input_forces[key]
-            new_input_forces[str(i)]['force_number'] = i
-        self.input_forces = new_input_forces
+        # Check Loads and renumber the remaining ones
+        delete_records(self.input_forces, [i for i, force in enumerate(self.input_forces)
+                                           if force.force_node not in self.nodes])
         # Disable edit button if no loads are defined
-        if self.input_forces == {}:
+        if not self.input_forces:
             self.add_load_initialise = 0
             self.edit_load_button.config(state='disabled')
 
-        # Update information window
-        self.update_system_information()
-        # Draw elements, supports and loads on canvas
-        self.canvas.delete("all")  # Clear the canvas
-        # Create grid, if selected
+        self.update_lookup_tables()
+        # Update information window and canvas
+        self.notify_changed('elements', 'supports', 'loads')
         self.nodes = []
-        self.toggle_grid()
-        self.draw_coordinate_system()
-        self.draw_element()
-        self.draw_support('black', None)
-        self.toggle_loads()
-        self.toggle_node_labels()
-        self.toggle_element_labels()
         self.update_node_comboboxes()
         self.toggle_run_calculation_button()
         # Update the combobox options and entry fields
@@ -1941,57 +2159,48 @@ class TrussAnalysisApp(tk.Tk):
             if force_node is None:
                 return
 
-            if self.force_x_entry.get():
-                force_x = float(self.force_x_entry.get())
-            else:
-                force_x = 0
-            if self.force_y_entry.get():
-                force_y = float(self.force_y_entry.get())
-            else:
-                force_y = 0
+            force_x = entry_float(self.force_x_entry, "the force F_x", 0)
+            force_y = entry_float(self.force_y_entry, "the force F_y", 0)
             # Check for duplicate load
-            if self.add_load_initialise == 1:
-                for key, force in self.input_forces.items():
-                    if force['force_node'] == force_node:
-                        messagebox.showerror("Duplicate load", "A load at this node already exists!"
-                                                               f"Consider editing load {key} instead.")
-                        return
-            # Add the new load to the input_forces dictionary
-            self.input_forces[str(self.force_number)] = {'force_number': self.force_number,
-                                                         'force_node': force_node,
-                                                         'f_x': force_x,
-                                                         'f_y': force_y}
-            # Increase unique element number
-            self.force_number += 1
+            key = self.force_keys_by_node.get(force_node)
+            if key is not None:
+                messagebox.showerror("Duplicate load", "A load at this node already exists!"
+                                                       f"Consider editing load {key} instead.")
+                return
+            # Add the new load to the input_forces list
+            self.input_forces.append(LoadRecord(force_node, force_x, force_y))
+            self.force_keys_by_node.setdefault(force_node, len(self.input_forces) - 1)
 
             # Clearing the entry boxes after adding the load
-            self.force_node_entry.delete(0, tk.END)
-            self.force_x_entry.delete(0, tk.END)
-            self.force_y_entry.delete(0, tk.END)
+            clear_entries(self.force_node_entry, self.force_x_entry, self.force_y_entry)
             # Set load initializer to 1, required to overwrite initial loads properly
             self.add_load_initialise = 1
-            # Update information window
-            self.update_system_information()
-            # Draw elements, supports and loads on canvas
+            # Update information window and canvas
+            self.notify_changed('loads')
             self.edit_load_button.config(state='normal')
-            self.canvas.delete("all")  # Clear the canvas
-            self.toggle_grid()
-            self.draw_coordinate_system()
-            self.draw_element()
-            self.draw_support('black', None)
-            self.toggle_loads()
-            self.toggle_node_labels()
-            self.toggle_element_labels()
             self.toggle_run_calculation_button()
+        except NumberError as e:
+            messagebox.showwarning("Warning", f"{e}")
+            return
         except Exception as e:
             # Show a warning message box
             messagebox.showerror("Error", f"An error occurred while adding the load: {e}")
             return
 
+    def update_edit_node_combobox(self, combobox):
+        combobox['values'] = tuple(self.node_label_to_value_map)
+        if self.node_label_to_value_map:
+            combobox.current(0)
+
     def edit_load(self):
+        # Reuse the edit window if it was already built
+        if reuse_window(self.edit_window_load):
+            self.update_edit_node_combobox(self.edit_force_node_entry)
+            self.update_load_dropdown()
+            return
         self.edit_window_load = tk.Toplevel(self)
-        set_icon(self.edit_window_load)
         self.edit_window_load.title("Edit Load")
+        self.edit_window_load.protocol("WM_DELETE_WINDOW", self.edit_window_load.withdraw)
         center_window(self.edit_window_load, 320, 170)
 
         # Frame for entry boxes and labels
@@ -2011,17 +2220,10 @@ class TrussAnalysisApp(tk.Tk):
         # self.edit_force_node_entry = ttk.Entry(edit_frame)
         self.edit_force_node_entry = ttk.Combobox(edit_frame, state="readonly")
         self.edit_force_node_entry.grid(row=1, column=1, sticky='ew', padx=5)
-        self.edit_force_node_entry['values'] = list(self.node_label_to_value_map.keys())
-        if self.node_label_to_value_map:
-            self.edit_force_node_entry.current(0)
+        self.update_edit_node_combobox(self.edit_force_node_entry)
 
-        ttk.Label(edit_frame, text="Force F_x [kN]:").grid(row=2, column=0, sticky='w')
-        self.edit_force_x_entry = ttk.Entry(edit_frame)
-        self.edit_force_x_entry.grid(row=2, column=1, sticky='ew', padx=5, pady=1)
-
-        ttk.Label(edit_frame, text="Force F_y [kN]:").grid(row=3, column=0, sticky='w')
-        self.edit_force_y_entry = ttk.Entry(edit_frame)
-        self.edit_force_y_entry.grid(row=3, column=1, sticky='ew', padx=5)
+        self.create_entry_rows(edit_frame, [("Force F_x [kN]:", 'edit_force_x_entry'),
+                                            ("Force F_y [kN]:", 'edit_force_y_entry')], first_row=2, variables=True)
 
         # Button for saving changes
         ttk.Button(edit_frame, text="Save Changes", command=self.save_load_changes).grid(row=4, column=1, padx=5,
@@ -2032,78 +2234,62 @@ class TrussAnalysisApp(tk.Tk):
         # Update Combobox
         self.update_node_comboboxes()
 
-        # Initially populate the entry boxes with the current values of the first load
-        self.populate_load_fields()
-
-        # Call update_load_dropdown to initialize the combobox values
+        # Initialize the combobox values and populate the entry boxes with the values of the first load
         self.update_load_dropdown()
 
     def populate_load_fields(self, event=None):
         selected_index = self.load_dropdown.current()
         if selected_index != -1:
-            force_id = list(self.input_forces.keys())[selected_index]
+            force_id = selected_index
             force = self.input_forces[force_id]
-            force_node = (force['force_node'][0], force['force_node'][1])
+            force_node = (force.force_node[0], force.force_node[1])
             combobox_index = self.node_value_to_index_map[f'{force_node}']
-            f_x = force['f_x']
-            f_y = force['f_y']
+            f_x = force.f_x
+            f_y = force.f_y
             self.edit_force_node_entry.current(combobox_index)
         else:
             self.edit_force_node_entry.current(0)
             f_x = " "
             f_y = " "
 
-        self.edit_force_x_entry.delete(0, tk.END)
-        self.edit_force_x_entry.insert(0, f"{f_x}")
-
-        self.edit_force_y_entry.delete(0, tk.END)
-        self.edit_force_y_entry.insert(0, f"{f_y}")
+        # One variable write per entry box instead of deleting and inserting the text
+        self.edit_force_x_var.set(f"{f_x}")
+        self.edit_force_y_var.set(f"{f_y}")
 
     def save_load_changes(self):
         try:
             selected_index = self.load_dropdown.current()
-            force_id = list(self.input_forces.keys())[selected_index]
+            force_id = selected_index
             # Parse the coordinates from the entry fields
             force_node = self.get_selected_node(self.edit_force_node_entry)
-            if self.edit_force_x_entry.get():
-                f_x = float(self.edit_force_x_entry.get())
-            else:
-                f_x = 0
-            if self.edit_force_y_entry.get():
-                f_y = float(self.edit_force_y_entry.get())
-            else:
-                f_y = 0
+            f_x = entry_float(self.edit_force_x_entry, "the force F_x", 0)
+            f_y = entry_float(self.edit_force_y_entry, "the force F_y", 0)
 
             # Update the load in the input_elements dictionary
-            self.input_forces[force_id] = {
-                'force_number': int(force_id),
-                'force_node': force_node,
-                'f_x': f_x,
-                'f_y': f_y}
-            # Update information window
-            self.update_system_information()
-            # Draw elements, supports and loads on canvas
-            self.canvas.delete("all")  # Clear the canvas
-            self.toggle_grid()
-            self.draw_coordinate_system()
-            self.draw_element()
-            self.draw_support('black', None)
-            self.toggle_loads()
-            self.toggle_node_labels()
-            self.toggle_element_labels()
+            load = LoadRecord(force_node, f_x, f_y)
+            if load == self.input_forces[force_id]:
+                # Nothing changed, only close the window
+                self.edit_window_load.withdraw()
+                return
+            self.input_forces[force_id] = load
+            self.update_lookup_tables()
+            # Update information window and canvas
+            self.notify_changed('loads')
             # Close window
-            self.edit_window_load.destroy()
+            self.edit_window_load.withdraw()
+        except NumberError as e:
+            messagebox.showwarning("Warning", f"{e}")
+            return
         except Exception as e:
             # Show a warning message box
             messagebox.showerror("Error", f"An error occurred while adding the load: {e}")
             return
 
     def update_load_dropdown(self):
-        load_ids = list(self.input_forces.keys())
-        load_display_values = [f"Load {number}" for number in load_ids]
-
-        self.load_dropdown['values'] = load_display_values
-        if load_ids:
+        # The dropdown index is the position of the record in the list
+        self.load_dropdown['values'] = resize_display_values(self.load_display_values, "Load",
+                                                             len(self.input_forces))
+        if self.input_forces:
             self.load_dropdown.current(0)
         else:
             self.load_dropdown.set('')
@@ -2115,29 +2301,14 @@ class TrussAnalysisApp(tk.Tk):
         if selected_index == -1:  # No selection
             return
 
-        load_id = list(self.input_forces.keys())[selected_index]
-        del self.input_forces[load_id]
-        # Renumbering the remaining loads
-        new_input_loads = {}
-        for i, key in enumerate(sorted(self.input_forces.keys())):
-            new_input_loads[str(i)] = self.input_forces[key]
-            new_input_loads[str(i)]['force_number'] = i
-
-        self.input_forces = new_input_loads
-        if self.input_forces == {}:
+        # Delete the load and renumber the following loads
+        delete_records(self.input_forces, [selected_index])
+        if not self.input_forces:
             self.edit_load_button.config(state='disabled')
             self.add_load_initialise = 0
-        # Update information window
-        self.update_system_information()
-        # Draw elements, supports and loads on canvas
-        self.canvas.delete("all")  # Clear the canvas
-        self.toggle_grid()
-        self.draw_coordinate_system()
-        self.draw_element()
-        self.draw_support('black', None)
-        self.toggle_loads()
-        self.toggle_node_labels()
-        self.toggle_element_labels()
+        self.update_lookup_tables()
+        # Update information window and canvas
+        self.notify_changed('loads')
         self.toggle_run_calculation_button()
         # Update the combobox options and entry fields
         self.update_load_dropdown()
@@ -2150,76 +2321,66 @@ class TrussAnalysisApp(tk.Tk):
             if support_node is None:
                 return
             # Parse stiffness
-            if self.stiffness_cx_entry.get():
-                if self.stiffness_cx_entry.get() != '∞':
-                    if float(self.stiffness_cx_entry.get()) < 0:
-                        messagebox.showwarning("Warning", f"Value of the spring stiffness c_x is negative! "
-                                                          f"The value of c_x is automatically set to positive.")
-                    c_x = abs(float(self.stiffness_cx_entry.get()))
-                else:
-                    c_x = self.stiffness_cx_entry.get()
-            else:
+            c_x = self.stiffness_cx_entry.get()
+            if not c_x:
                 messagebox.showwarning("Warning", f"Value of the spring stiffness c_x is empty! "
                                                   f"The value of the spring stiffness is set to c_x = 0!")
                 c_x = 0
-            if self.stiffness_cy_entry.get():
-                if self.stiffness_cy_entry.get() != '∞':
-                    if float(self.stiffness_cy_entry.get()) < 0:
-                        messagebox.showwarning("Warning", f"Value of the spring stiffness c_y is negative! "
-                                                          f"The value of c_y is automatically set to positive.")
-                    c_y = abs(float(self.stiffness_cy_entry.get()))
-                else:
-                    c_y = self.stiffness_cy_entry.get()
-            else:
+            elif c_x != '∞':
+                c_x = parse_number(c_x, "the spring stiffness c_x")
+                if c_x < 0:
+                    messagebox.showwarning("Warning", f"Value of the spring stiffness c_x is negative! "
+                                                      f"The value of c_x is automatically set to positive.")
+                c_x = abs(c_x)
+            c_y = self.stiffness_cy_entry.get()
+            if not c_y:
                 messagebox.showwarning("Warning", f"Value of the spring stiffness c_y is empty! "
                                                   f"The value of the spring stiffness is set to c_y = 0!")
                 c_y = 0
+            elif c_y != '∞':
+                c_y = parse_number(c_y, "the spring stiffness c_y")
+                if c_y < 0:
+                    messagebox.showwarning("Warning", f"Value of the spring stiffness c_y is negative! "
+                                                      f"The value of c_y is automatically set to positive.")
+                c_y = abs(c_y)
 
             # Check for duplicate support
-            if self.add_support_initialise == 1:
-                for key, support in self.input_supports.items():
-                    if support['sup_node'] == support_node:
-                        messagebox.showerror("Duplicate Support", "A support with this node already exists!"
-                                                                  f"Consider editing support {key} instead!")
-                        return
-
-            # Add the new support to the input_supports dictionary
-            self.input_supports[str(self.support_number)] = {'sup_number': self.support_number,
-                                                             'sup_node': support_node,
-                                                             'c_x': c_x,
-                                                             'c_y': c_y}
-            # Increase unique element number
-            self.support_number += 1
+            key = self.support_keys_by_node.get(support_node)
+            if key is not None:
+                messagebox.showerror("Duplicate Support", "A support with this node already exists!"
+                                                          f"Consider editing support {key} instead!")
+                return
+
+            # Add the new support to the input_supports list
+            self.input_supports.append(SupportRecord(support_node, c_x, c_y))
+            self.support_keys_by_node.setdefault(support_node, len(self.input_supports) - 1)
 
             # Clearing the entry boxes after adding the support
-            self.support_node_entry.delete(0, tk.END)
-            self.stiffness_cx_entry.delete(0, tk.END)
-            self.stiffness_cy_entry.delete(0, tk.END)
+            clear_entries(self.support_node_entry, self.stiffness_cx_entry, self.stiffness_cy_entry)
             # Set support initializer to 1, required to overwrite initial supports properly
             self.add_support_initialise = 1
-            # Update information window
-            self.update_system_information()
-            # Draw elements, supports and loads on canvas
+            # Update information window and canvas
+            self.notify_changed('supports')
             self.edit_support_button.config(state='normal')
-            self.canvas.delete("all")  # Clear the canvas
-            self.toggle_grid()
-            self.draw_coordinate_system()
-            self.draw_element()
-            self.draw_support('black', None)
-            self.toggle_loads()
-            self.toggle_node_labels()
-            self.toggle_element_labels()
             self.toggle_run_calculation_button()
 
+        except NumberError as e:
+            messagebox.showwarning("Warning", f"{e}")
+            return
         except Exception as e:
             # Show a warning message box
             messagebox.showerror("Error", f"An error occurred while adding the support: {e}")
             return
 
     def edit_support(self):
+        # Reuse the edit window if it was already built
+        if reuse_window(self.edit_window_support):
+            self.update_edit_node_combobox(self.edit_support_node_entry)
+            self.update_support_dropdown()
+            return
         self.edit_window_support = tk.Toplevel(self)
-        set_icon(self.edit_window_support)
         self.edit_window_support.title("Edit Support")
+        self.edit_window_support.protocol("WM_DELETE_WINDOW", self.edit_window_support.withdraw)
         center_window(self.edit_window_support, 320, 210)
 
         # Frame for entry boxes and labels
@@ -2239,9 +2400,7 @@ class TrussAnalysisApp(tk.Tk):
         # self.edit_support_node_entry = ttk.Entry(edit_frame)
         self.edit_support_node_entry = ttk.Combobox(edit_frame, state="readonly")
         self.edit_support_node_entry.grid(row=1, column=1, sticky='ew', padx=5)
-        self.edit_support_node_entry['values'] = list(self.node_label_to_value_map.keys())
-        if self.node_label_to_value_map:
-            self.edit_support_node_entry.current(0)
+        self.update_edit_node_combobox(self.edit_support_node_entry)
 
         ttk.Label(edit_frame, text="Rigid in x-direction:").grid(row=2, column=0, sticky='w')
         self.edit_support_rigid_cx_state = tk.BooleanVar(value=True)
@@ -2255,13 +2414,9 @@ class TrussAnalysisApp(tk.Tk):
                                                      command=self.toggle_edit_stiffness_cy)
         self.edit_support_rigid_cy.grid(row=3, column=1, sticky='w', padx=5)
 
-        ttk.Label(edit_frame, text="Stiffness c_x [kN/m]:").grid(row=4, column=0, sticky='w')
-        self.edit_stiffness_cx_entry = ttk.Entry(edit_frame)
-        self.edit_stiffness_cx_entry.grid(row=4, column=1, sticky='ew', padx=5)
-
-        ttk.Label(edit_frame, text="Stiffness c_y [kN/m]:").grid(row=5, column=0, sticky='w')
-        self.edit_stiffness_cy_entry = ttk.Entry(edit_frame)
-        self.edit_stiffness_cy_entry.grid(row=5, column=1, sticky='ew', padx=5, pady=1)
+        self.create_entry_rows(edit_frame, [("Stiffness c_x [kN/m]:", 'edit_stiffness_cx_entry'),
+                                            ("Stiffness c_y [kN/m]:", 'edit_stiffness_cy_entry')], first_row=4,
+                               variables=True)
 
         # Button for saving changes
         ttk.Button(edit_frame, text="Save Changes", command=self.save_support_changes).grid(row=6, column=1, padx=5,
@@ -2272,49 +2427,41 @@ class TrussAnalysisApp(tk.Tk):
         # Update Combobox
         self.update_node_comboboxes()
 
-        # Initially populate the entry boxes with the current values of the first support
-        self.populate_support_fields()
-
-        # Call update_support_dropdown to initialize the combobox values
+        # Initialize the combobox values and populate the entry boxes with the values of the first support
         self.update_support_dropdown()
 
     def toggle_edit_stiffness_cx(self):
         if self.edit_support_rigid_cx_state.get():
-            self.edit_stiffness_cx_entry.delete(0, tk.END)
-            self.edit_stiffness_cx_entry.insert(0, '∞')
+            self.edit_stiffness_cx_var.set('∞')
             self.edit_stiffness_cx_entry.configure(state='readonly')
         else:
             self.edit_stiffness_cx_entry.configure(state='normal')
-            self.edit_stiffness_cx_entry.delete(0, tk.END)
-            self.edit_stiffness_cx_entry.insert(0, str(self.edit_cx))
+            self.edit_stiffness_cx_var.set(str(self.edit_cx))
 
     def toggle_edit_stiffness_cy(self):
         if self.edit_support_rigid_cy_state.get():
-            self.edit_stiffness_cy_entry.delete(0, tk.END)
-            self.edit_stiffness_cy_entry.insert(0, '∞')
+            self.edit_stiffness_cy_var.set('∞')
             self.edit_stiffness_cy_entry.configure(state='readonly')
         else:
             self.edit_stiffness_cy_entry.configure(state='normal')
-            self.edit_stiffness_cy_entry.delete(0, tk.END)
-            self.edit_stiffness_cy_entry.insert(0, str(self.edit_cy))
+            self.edit_stiffness_cy_var.set(str(self.edit_cy))
 
     def populate_support_fields(self, event=None):
         selected_index = self.support_dropdown.current()
         if selected_index != -1:
-            support_id = list(self.input_supports.keys())[selected_index]
+            support_id = selected_index
             support = self.input_supports[support_id]
-            support_node = (support['sup_node'][0], support['sup_node'][1])
+            support_node = (support.sup_node[0], support.sup_node[1])
             combobox_index = self.node_value_to_index_map[f'{support_node}']
-            c_x = support['c_x']
-            c_y = support['c_y']
+            c_x = support.c_x
+            c_y = support.c_y
             self.edit_support_node_entry.current(combobox_index)
         else:
             c_x = " "
             c_y = " "
             self.edit_support_node_entry.current(0)
 
-        self.edit_stiffness_cx_entry.delete(0, tk.END)
-        self.edit_stiffness_cx_entry.insert(0, f"{c_x}")
+        self.edit_stiffness_cx_var.set(f"{c_x}")
         if c_x == '∞':
             self.edit_stiffness_cx_entry.configure(state='readonly')
             self.edit_support_rigid_cx_state.set(True)
@@ -2323,8 +2470,7 @@ class TrussAnalysisApp(tk.Tk):
             self.edit_support_rigid_cx_state.set(False)
             self.edit_cx = c_x
 
-        self.edit_stiffness_cy_entry.delete(0, tk.END)
-        self.edit_stiffness_cy_entry.insert(0, f"{c_y}")
+        self.edit_stiffness_cy_var.set(f"{c_y}")
         if c_y == '∞':
             self.edit_stiffness_cy_entry.configure(state='readonly')
             self.edit_support_rigid_cy_state.set(True)
@@ -2339,64 +2485,57 @@ class TrussAnalysisApp(tk.Tk):
     def save_support_changes(self):
         try:
             selected_index = self.support_dropdown.current()
-            support_id = list(self.input_supports.keys())[selected_index]
+            support_id = selected_index
             # Parse the coordinates from the entry fields
             support_node = self.get_selected_node(self.edit_support_node_entry)
-            if self.edit_stiffness_cx_entry.get():
-                if self.edit_stiffness_cx_entry.get() != '∞':
-                    if float(self.edit_stiffness_cx_entry.get()) < 0:
-                        messagebox.showwarning("Warning", f"Value of the spring stiffness c_x is negative! "
-                                                          f"The value of c_x is automatically set to positive.")
-                    c_x = abs(float(self.edit_stiffness_cx_entry.get()))
-                else:
-                    c_x = self.edit_stiffness_cx_entry.get()
-            else:
+            c_x = self.edit_stiffness_cx_entry.get()
+            if not c_x:
                 messagebox.showwarning("Warning", f"Value of the spring stiffness c_x is empty! "
                                                   f"The of the spring stiffness is set to c_x = 0!")
                 c_x = 0
-            if self.edit_stiffness_cy_entry.get():
-                if self.edit_stiffness_cy_entry.get() != '∞':
-                    if float(self.edit_stiffness_cy_entry.get()) < 0:
-                        messagebox.showwarning("Warning", f"Value of the spring stiffness c_y is negative! "
-                                                          f"The value of c_y is automatically set to positive.")
-                    c_y = abs(float(self.edit_stiffness_cy_entry.get()))
-                else:
-                    c_y = self.edit_stiffness_cy_entry.get()
-            else:
+            elif c_x != '∞':
+                c_x = parse_number(c_x, "the spring stiffness c_x")
+                if c_x < 0:
+                    messagebox.showwarning("Warning", f"Value of the spring stiffness c_x is negative! "
+                                                      f"The value of c_x is automatically set to positive.")
+                c_x = abs(c_x)
+            c_y = self.edit_stiffness_cy_entry.get()
+            if not c_y:
                 messagebox.showwarning("Warning", f"Value of the spring stiffness c_y is empty! "
                                                   f"The of the spring stiffness is set to c_y = 0!")
                 c_y = 0
+            elif c_y != '∞':
+                c_y = parse_number(c_y, "the spring stiffness c_y")
+                if c_y < 0:
+                    messagebox.showwarning("Warning", f"Value of the spring stiffness c_y is negative! "
+                                                      f"The value of c_y is automatically set to positive.")
+                c_y = abs(c_y)
 
             # Update the load in the input_elements dictionary
-            self.input_supports[support_id] = {
-                'sup_number': int(support_id),
-                'sup_node': support_node,
-                'c_x': c_x,
-                'c_y': c_y}
-            # Update information window
-            self.update_system_information()
-            # Draw elements, supports and loads on canvas
-            self.canvas.delete("all")  # Clear the canvas
-            self.toggle_grid()
-            self.draw_coordinate_system()
-            self.draw_element()
-            self.draw_support('black', None)
-            self.toggle_loads()
-            self.toggle_node_labels()
-            self.toggle_element_labels()
+            support = SupportRecord(support_node, c_x, c_y)
+            if support == self.input_supports[support_id]:
+                # Nothing changed, only close the window
+                self.edit_window_support.withdraw()
+                return
+            self.input_supports[support_id] = support
+            self.update_lookup_tables()
+            # Update information window and canvas
+            self.notify_changed('supports')
             # Close window
-            self.edit_window_support.destroy()
+            self.edit_window_support.withdraw()
+        except NumberError as e:
+            messagebox.showwarning("Warning", f"{e}")
+            return
         except Exception as e:
             # Show a warning message box
             messagebox.showerror("Error", f"An error occurred while adding the support: {e}")
             return
 
     def update_support_dropdown(self):
-        support_ids = list(self.input_supports.keys())
-        support_display_values = [f"Support {number}" for number in support_ids]
-
-        self.support_dropdown['values'] = support_display_values
-        if support_ids:
+        # The dropdown index is the position of the record in the list
+        self.support_dropdown['values'] = resize_display_values(self.support_display_values, "Support",
+                                                                len(self.input_supports))
+        if self.input_supports:
             self.support_dropdown.current(0)
         else:
             self.support_dropdown.set('')
@@ -2408,30 +2547,15 @@ class TrussAnalysisApp(tk.Tk):
         if selected_index == -1:  # No selection
             return
 
-        support_id = list(self.input_supports.keys())[selected_index]
-        del self.input_supports[support_id]
-        # Renumbering the remaining supports
-        new_input_supports = {}
-        for i, key in enumerate(sorted(self.input_supports.keys())):
-            new_input_supports[str(i)] = self.input_supports[key]
-            new_input_supports[str(i)]['sup_number'] = i
-
-        self.input_supports = new_input_supports
-        if self.input_supports == {}:
+        # Delete the support and renumber the following supports
+        delete_records(self.input_supports, [selected_index])
+        if not self.input_supports:
             self.edit_support_button.config(state='disabled')
             self.add_support_initialise = 0
-        # Update information window
-        self.update_system_information()
-        # Draw elements, supports and loads on canvas
-        self.canvas.delete("all")  # Clear the canvas
-        self.toggle_grid()
-        self.draw_coordinate_system()
-        self.draw_element()
-        self.draw_support('black', None)
-        self.toggle_loads()
+        self.update_lookup_tables()
+        # Update information window and canvas
+        self.notify_changed('supports')
         self.toggle_run_calculation_button()
-        self.toggle_node_labels()
-        self.toggle_element_labels()
         # Update the combobox options and entry fields
         self.update_support_dropdown()
 
@@ -2447,53 +2571,65 @@ class TrussAnalysisApp(tk.Tk):
                     # Show a warning message box
                     messagebox.showwarning("Warning", "Number of iterations must be an integer!")
                     return
+                # Without a value only the criterion ΔF_max stops the iteration
+                delta_u = abs(entry_float(self.delta_u_entry, "the step Δu_max", 0))
             else:
                 number_of_iterations = 0
                 delta_f = 0
+                delta_u = 0
 
             # Add the new load to the input_forces dictionary
             self.input_calc_param = {'calc_method': method,
                                      'number_of_iterations': number_of_iterations,
-                                     'delta_f_max': delta_f}
+                                     'delta_f_max': delta_f,
+                                     'delta_u_max': delta_u}
             # Set calculation parameter initializer to 1, required to overwrite initial parameters properly
             self.add_calc_initialise = 1
             # Update information window
-            self.update_system_information()
+            self.notify_changed('calc')
+        except NumberError as e:
+            messagebox.showwarning("Warning", f"{e}")
+            return
         except Exception as e:
             # Show a warning message box
             messagebox.showerror("Error", f"An error occurred while saving the calculation settings: {e}")
             return
 
-    def parse_coordinates(self, coord_str: str) -> tuple[float, float]:
-        # Removing common bracket types and spaces
-        coord_str = coord_str.replace('(', '').replace(')', '').replace('[', '').replace(']', '').replace(' ', '')
-        # Splitting the string by comma and converting to float
-        try:
-            x, y = map(float, coord_str.split(','))
-            return (x, y)
-        except ValueError as e:
-            # Show a warning message box
-            messagebox.showwarning("Warning", "Invalid coordinate format. Please enter as x,y or [x, y] or (x, y)!")
-            return None
-
     def run_calculation(self):
+        # Imported on first use, the module is normally already loaded by warm_up_solver
+        from calculation import Calculation
         try:
-            # Check Input parameters for errors:
-            ele_quad_coeff = []
-            for ele_id, ele_values in self.input_elements.items():
-                ele_quad_coeff.append(abs(ele_values['ele_quad_coeff']))
-            if (self.input_calc_param['calc_method'] in 'NR' or self.input_calc_param[
-                'calc_method'] in 'modNR') and sum(
-                ele_quad_coeff) == 0:
+            # Check Input parameters for errors, the nonlinear methods need an element with β != 0
+            calc_method = self.input_calc_param['calc_method']
+            if ((calc_method in 'NR' or calc_method in 'modNR')
+                    and not any(ele.ele_quad_coeff for ele in self.input_elements)):
                 messagebox.showwarning("Warning", f"You selected a nonlinear Newton-Raphson calculation, "
                                                   f"but you set the nonlinear parameter β of all elements to 0! "
                                                   f"Calculating linear...")
                 self.input_calc_param['calc_method'] = 'linear'
                 self.method_combobox.current(0)
-            # Run Calculation
-            calculation = Calculation(self.input_elements, self.input_supports, self.input_forces,
-                                      self.input_calc_param)
-            self.solution = calculation.return_solution()
+            # Run Calculation in the worker thread on array snapshots of the input, the GUI stays responsive meanwhile
+            calculation = Calculation.from_arrays(*record_arrays(self.input_elements, self.input_supports,
+                                                                 self.input_forces), dict(self.input_calc_param))
+            self.run_calculation_button.config(state='disabled')
+            self.calculation_future = self.calculation_executor.submit(calculation.return_solution)
+            self.after(GUI_Settings.CALCULATION_POLL_INTERVAL, self.finish_calculation, self.calculation_future)
+        except Exception as e:
+            # Show a warning message box
+            messagebox.showerror("Error", f"An error occurred while running the calculation: {e}")
+            return
+
+    def finish_calculation(self, future):
+        # Discard results of a system that was cleared or replaced while it was calculated
+        if future is not self.calculation_future:
+            return
+        if not future.done():
+            self.after(GUI_Settings.CALCULATION_POLL_INTERVAL, self.finish_calculation, future)
+            return
+        self.calculation_future = None
+        self.toggle_run_calculation_button()
+        try:
+            self.solution = future.result()
             if self.solution is not None and self.solution['error_linalg'] is None:
                 # Check if the linear calculation results are available
                 if 'node_displacements_linear' in self.solution and self.solution[
@@ -2506,10 +2642,11 @@ class TrussAnalysisApp(tk.Tk):
                     self.node_to_index = {node: index for index, node in enumerate(self.solution['nodes'])}
                     # Copy linear displacements for plotting
                     self.linear_displacement = self.solution['node_displacements_linear']
-                    print('The axial forces of the linear elastic calculation are:')
-                    print(self.solution['axial_forces_linear'])
-                    print('The global forces equilibrium (linear support reaction forces) are:')
-                    print(self.solution['node_equilibrium_linear'])
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.debug("The axial forces of the linear elastic calculation are:\n%s",
+                                     self.solution['axial_forces_linear'])
+                        logger.debug("The global forces equilibrium (linear support reaction forces) are:\n%s",
+                                     self.solution['node_equilibrium_linear'])
                 else:
                     # Disable the button if linear results are not available
                     self.plot_linear_deformation.config(state='disabled')
@@ -2518,10 +2655,11 @@ class TrussAnalysisApp(tk.Tk):
                     self.plot_nonlinear_forces.config(state='normal')
                     # Copy linear displacements for plotting
                     self.nonlinear_displacement = self.solution['node_displacements_nonlinear']
-                    print('The axial forces of the nonlinear elastic / ideal plastic calculation are:')
-                    print(self.solution['axial_forces_nonlinear'])
-                    print('The global forces equilibrium (nonlinear support reaction forces) are:')
-                    print(self.solution['node_equilibrium_nonlinear'])
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.debug("The axial forces of the nonlinear elastic / ideal plastic calculation are:\n%s",
+                                     self.solution['axial_forces_nonlinear'])
+                        logger.debug("The global forces equilibrium (nonlinear support reaction forces) are:\n%s",
+                                     self.solution['node_equilibrium_nonlinear'])
 
                 self.update_calculation_information()
 
@@ -2538,24 +2676,28 @@ class TrussAnalysisApp(tk.Tk):
             return
 
     def clear_all(self):
-        self.canvas.delete("all")  # Clear the canvas
-        self.draw_coordinate_system()
-        self.input_elements = copy.deepcopy(self.input_elements_init)
-        self.input_supports = copy.deepcopy(self.input_supports_init)
-        self.input_forces = copy.deepcopy(self.input_forces_init)
-        self.input_calc_param = copy.deepcopy(self.input_calc_param_init)
+        # Drop a pending redraw of the previous system
+        if self.canvas_redraw_job is not None:
+            self.after_cancel(self.canvas_redraw_job)
+            self.canvas_redraw_job = None
+        self.canvas.delete("!axes")  # Clear the canvas, except for the coordinate system
+        self.element_items = {}
+        self.deformation_items = {}
+        self.view_cache = None
+        self.input_elements = new_input_elements()
+        self.input_supports = new_input_supports()
+        self.input_forces = new_input_forces()
+        self.input_calc_param = new_input_calc_param()
         self.add_element_initialise = 0
         self.add_support_initialise = 0
         self.add_load_initialise = 0
         self.add_calc_initialise = 0
-        self.ele_number = 0
-        self.force_number = 0
-        self.support_number = 0
         self.edit_cx = 0
         self.edit_cy = 0
         self.max_force = 1
         self.nodes = []
         self.solution = None
+        self.calculation_future = None
         self.plot_linear_deformation.config(state='disabled')
         self.plot_linear_forces.config(state='disabled')
         self.export_plot.config(state='disabled')
@@ -2566,17 +2708,16 @@ class TrussAnalysisApp(tk.Tk):
         self.edit_support_button.config(state='disabled')
         self.add_load_button.config(state='disabled')
         self.add_support_button.config(state='disabled')
-        self.num_iterations_entry.delete(0, tk.END)
-        self.delta_f_entry.delete(0, tk.END)
+        clear_entries(self.num_iterations_entry, self.delta_f_entry, self.delta_u_entry)
         self.method_combobox.current(0)
         self.show_grid_state.set(True)
         self.show_loads_state.set(True)
         self.show_header_state.set(False)
         self.show_node_labels_state.set(False)
         self.show_element_labels_state.set(False)
+        self.update_lookup_tables()
         # Update information window
-        self.update_system_information()
-        # Update information window
+        self.schedule_system_information_update()
         self.update_calculation_information()
         self.toggle_grid()
         self.update_node_comboboxes()
@@ -2584,91 +2725,73 @@ class TrussAnalysisApp(tk.Tk):
 
     def save_to_file(self):
         data = {
-            'input_elements': self.input_elements,
-            'input_supports': self.input_supports,
-            'input_forces': self.input_forces,
+            # The file keeps the records keyed by their number
+            'input_elements': numbered_records(self.input_elements, 'ele_number'),
+            'input_supports': numbered_records(self.input_supports, 'sup_number'),
+            'input_forces': numbered_records(self.input_forces, 'force_number'),
             'input_calc_param': self.input_calc_param
         }
         file_path = filedialog.asksaveasfilename(defaultextension=".json",
                                                  filetypes=[("JSON files", "*.json")])
         if file_path:
-            with open(file_path, 'w') as file:
-                json.dump(data, file, indent=4)
+            write_input_file(file_path, data)
             messagebox.showinfo("Save File", "Input parameters successfully saved to file.")
 
     def load_from_file(self):
-        self.clear_all()
-        file_path = filedialog.askopenfilename(filetypes=[("JSON files", "*.json")])
-        if file_path:
-            with open(file_path, 'r') as file:
-                data = json.load(file)
-            # Convert lists back to tuples for nodes
-            if 'input_elements' in data:
-                self.add_element_initialise = 1
-                self.ele_number = 0
-                self.edit_element_button.config(state='normal')
-                self.add_support_button.config(state='normal')
-                self.add_load_button.config(state='normal')
-                for key, element in data['input_elements'].items():
-                    self.ele_number += 1
-                    if 'ele_node_i' in element:
-                        element['ele_node_i'] = tuple(element['ele_node_i'])
-                    if 'ele_node_j' in element:
-                        element['ele_node_j'] = tuple(element['ele_node_j'])
-
-            if 'input_supports' in data:
-                self.add_support_initialise = 1
-                self.support_number = 0
-                self.edit_support_button.config(state='normal')
-                for key, support in data['input_supports'].items():
-                    self.support_number += 1
-                    if 'sup_node' in support:
-                        support['sup_node'] = tuple(support['sup_node'])
-
-            if 'input_forces' in data:
-                self.add_load_initialise = 1
-                self.force_number = 0
-                self.edit_load_button.config(state='normal')
-                for key, force in data['input_forces'].items():
-                    self.force_number += 1
-                    if 'force_node' in force:
-                        force['force_node'] = tuple(force['force_node'])
-            if 'input_calc_param' in data:
-                self.add_calc_initialise = 1
-                self.num_iterations_entry.delete(0, tk.END)
-                self.num_iterations_entry.insert(0, f"{data['input_calc_param']['number_of_iterations']}")
-                self.delta_f_entry.delete(0, tk.END)
-                self.delta_f_entry.insert(0, f"{data['input_calc_param']['delta_f_max']}")
-                loaded_method = data['input_calc_param']['calc_method']
-                method_index = self.methods.index(loaded_method) if loaded_method in self.methods else 0
-                self.method_combobox.current(method_index)
-            self.input_elements = data.get('input_elements', {})
-            self.input_supports = data.get('input_supports', {})
-            self.input_forces = data.get('input_forces', {})
-            self.input_calc_param = data.get('input_calc_param', {})
-            # Update the UI with loaded data
-            self.update_system_information()
-            messagebox.showinfo("Load File", "Input parameters successfully loaded from file.")
-            # Draw elements, supports and loads on canvas
-            self.canvas.delete("all")  # Clear the canvas
-            self.plot_button.config(state='normal')
-            self.draw_coordinate_system()
-            self.toggle_grid()
-            self.draw_element()
-            self.draw_support('black', None)
-            self.toggle_loads()
-            self.toggle_node_labels()
-            self.toggle_element_labels()
-            self.update_node_comboboxes()
-            self.toggle_run_calculation_button()
+        with self.batched_updates():
+            self.clear_all()
+            file_path = filedialog.askopenfilename(filetypes=[("JSON files", "*.json")])
+            if file_path:
+                data = read_input_file(file_path)
+                # The records are stored as lists in file order, the numbers follow the positions
+                for name, record_type, number_key in (('input_elements', ElementRecord, 'ele_number'),
+                                                      ('input_supports', SupportRecord, 'sup_number'),
+                                                      ('input_forces', LoadRecord, 'force_number')):
+                    if name in data:
+                        data[name] = records_from_file(data[name], record_type, number_key)
+                if data.get('input_elements'):
+                    self.add_element_initialise = 1
+                    self.edit_element_button.config(state='normal')
+                    self.add_support_button.config(state='normal')
+                    self.add_load_button.config(state='normal')
+
+                if data.get('input_supports'):
+                    self.add_support_initialise = 1
+                    self.edit_support_button.config(state='normal')
+
+                if data.get('input_forces'):
+                    self.add_load_initialise = 1
+                    self.edit_load_button.config(state='normal')
+                if 'input_calc_param' in data:
+                    self.add_calc_initialise = 1
+                    self.num_iterations_entry.delete(0, tk.END)
+                    self.num_iterations_entry.insert(0, f"{data['input_calc_param']['number_of_iterations']}")
+                    self.delta_f_entry.delete(0, tk.END)
+                    self.delta_f_entry.insert(0, f"{data['input_calc_param']['delta_f_max']}")
+                    # Files of older versions have no step criterion
+                    if data['input_calc_param'].get('delta_u_max'):
+                        self.delta_u_entry.insert(0, f"{data['input_calc_param']['delta_u_max']}")
+                    loaded_method = data['input_calc_param']['calc_method']
+                    method_index = self.methods.index(loaded_method) if loaded_method in self.methods else 0
+                    self.method_combobox.current(method_index)
+                self.input_elements = data.get('input_elements', [])
+                self.input_supports = data.get('input_supports', [])
+                self.input_forces = data.get('input_forces', [])
+                self.input_calc_param = data.get('input_calc_param', {})
+                # Update the UI with loaded data
+                self.update_lookup_tables()
+                self.notify_changed()
+                messagebox.showinfo("Load File", "Input parameters successfully loaded from file.")
+                self.plot_button.config(state='normal')
+                self.update_node_comboboxes()
+                self.toggle_run_calculation_button()
 
     def plot_system(self):
-        # Clear existing canvas
-        self.canvas.delete("all")
-        # Draw coordinate system
-        self.draw_coordinate_system()
-        # Draw elements, supports, and loads
+        # Clear existing canvas, the elements are kept and moved by draw_element
+        self.canvas.delete("!(element||axes)")
+        # Create grid, if selected, the coordinate system is kept
         self.toggle_grid()
+        # Draw elements, supports, and loads
         self.draw_element()
         self.draw_support('black', None)
         self.toggle_loads()
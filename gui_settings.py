@@ -42,6 +42,8 @@ class GUI_Settings:
     CANVAS_BG = 'white'  # Light gray
     CANVAS_COORD_COLOR = '#262626'  # Dark gray
     WINDOWS_SMALL_BG_COLOR = '#D2D2D2'  # Light gray
+    GRID_COLOR = '#BEBEBE'  # Gray
+    GRID_MINOR_COLOR = '#C9C9C9'  # Gray79
     # Fonts/Styles
     FRAME_HEADER_FONT = ('Arial', 12, 'bold')
     STANDARD_FONT_1 = ('Arial', 12)
@@ -54,6 +56,11 @@ class GUI_Settings:
     FRAME_WIDTH_COL1 = 170
     FRAME_WIDTH_COL2 = 155
 
+    # Interval in ms to check if the calculation in the worker thread has finished
+    CALCULATION_POLL_INTERVAL = 50
+    # Minimum interval in ms between two redraws of the canvas (about 60 redraws per second)
+    CANVAS_REDRAW_INTERVAL = 16
+
     # Text for Tutorial
 #     @staticmethod
 #     def return_tutorial():